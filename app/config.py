@@ -19,8 +19,18 @@ class Config:
     ORACLE_DSN = os.environ.get('ORACLE_DSN', 'localhost:1521/XEPDB1')
     SQLALCHEMY_DATABASE_URI = f"oracle+oracledb://{ORACLE_USER}:{ORACLE_PASSWORD}@{ORACLE_DSN}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_POOL_SIZE = 10
-    SQLALCHEMY_MAX_OVERFLOW = 20
+    # Flask-SQLAlchemy 3.x ignores the legacy SQLALCHEMY_POOL_* keys, so pool
+    # sizing must go through engine options to actually take effect. This keeps
+    # a persistent pool of connections across requests instead of paying
+    # connection setup per call. pre_ping revalidates a connection on checkout
+    # so ones dropped by the server (idle timeout, failover) are replaced
+    # transparently instead of surfacing as intermittent request errors.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 20,
+        'max_overflow': 40,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
     
     # JWT Configuration
     JWT_SECRET_KEY = os.environ.get('JWT_SECRET_KEY') or SECRET_KEY
@@ -86,6 +96,8 @@ class TestingConfig(Config):
     TESTING = True
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # In-memory SQLite runs on a StaticPool which takes no sizing arguments
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     WTF_CSRF_ENABLED = False
     RATELIMIT_ENABLED = False
 
@@ -129,10 +141,13 @@ class ProductionConfig(Config):
 class VercelConfig(ProductionConfig):
     """Vercel serverless configuration"""
     # Serverless-specific settings
-    SQLALCHEMY_POOL_SIZE = 1
-    SQLALCHEMY_MAX_OVERFLOW = 0
-    SQLALCHEMY_POOL_TIMEOUT = 30
-    SQLALCHEMY_POOL_RECYCLE = 300
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 1,
+        'max_overflow': 0,
+        'pool_timeout': 30,
+        'pool_recycle': 300,
+        'pool_pre_ping': True,
+    }
 
 
 # Configuration dictionary
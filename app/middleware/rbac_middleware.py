@@ -77,27 +77,30 @@ def require_roles(allowed_roles):
         def admin_function():
             pass
     """
+    # Resolved once at decoration time; the per-request check is a single
+    # frozenset membership and the denial message needs no re-joining
+    allowed = frozenset(allowed_roles) | {'SUPER_ADMIN'}
+    denial_message = f'Access denied. Required role: {", ".join(allowed_roles)}'
+
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
             user = getattr(g, 'current_user', None)
-            
+
             if not user:
                 raise ForbiddenException('Authentication required')
-            
+
             user_role = user.get('role')
-            
-            if user_role != 'SUPER_ADMIN' and user_role not in allowed_roles:
+
+            if user_role not in allowed:
                 current_app.logger.warning(
                     f"Role access denied: User {user['user_id']} with role {user_role} "
                     f"attempted to access route requiring {allowed_roles}"
                 )
-                raise ForbiddenException(
-                    f'Access denied. Required role: {", ".join(allowed_roles)}'
-                )
-            
+                raise ForbiddenException(denial_message)
+
             return f(*args, **kwargs)
-        
+
         return decorated
     return decorator
 
@@ -111,25 +114,31 @@ def require_permission(resource: str, action: str):
         def create_schedule():
             pass
     """
+    # The permission matrix is static, so the set of roles allowed to
+    # perform this action resolves once when the route is registered
+    permitted = frozenset(
+        role for role, perms in ROLE_PERMISSIONS.items()
+        if action in perms.get(resource, [])
+    )
+    denial_message = f'You do not have permission to {action} {resource}'
+
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
             user = getattr(g, 'current_user', None)
-            
+
             if not user:
                 raise ForbiddenException('Authentication required')
-            
-            if not has_permission(user['role'], resource, action):
+
+            if user['role'] not in permitted:
                 current_app.logger.warning(
                     f"Permission denied: User {user['user_id']} with role {user['role']} "
                     f"attempted {action} on {resource}"
                 )
-                raise ForbiddenException(
-                    f'You do not have permission to {action} {resource}'
-                )
-            
+                raise ForbiddenException(denial_message)
+
             return f(*args, **kwargs)
-        
+
         return decorated
     return decorator
 
@@ -83,11 +83,16 @@ def list_college_users():
     status = request.args.get('status')
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 20, type=int)
-    
+    cursor = request.args.get('cursor')
+    include_total = request.args.get('include_total', 'true').lower() != 'false'
+    fields = request.args.get('fields')
+
     service = UserService()
     result = service.get_users(role_filter=role, status_filter=status,
                                college_id_filter=college_id,
-                               page=page, per_page=per_page)
+                               page=page, per_page=per_page,
+                               after_cursor=cursor, include_total=include_total,
+                               fields=fields.split(',') if fields else None)
     
     if 'error' in result:
         return jsonify(result), 403
@@ -145,11 +150,33 @@ def deactivate_user(user_id):
     """Deactivate a user in own college"""
     service = UserService()
     result = service.deactivate_user(user_id)
-    
+
     if 'error' in result:
         status_map = {'ACCESS_DENIED': 403, 'NOT_FOUND': 404, 'VALIDATION': 400}
         return jsonify(result), status_map.get(result['error'], 500)
-    
+
+    return jsonify(result)
+
+
+@college_admin_bp.route('/users/bulk-deactivate', methods=['POST'])
+@require_auth
+@require_roles(['COLLEGE_ADMIN'])
+@require_tenant_access
+def bulk_deactivate_users():
+    """Deactivate several users in own college in one transaction"""
+    data = request.get_json() or {}
+    user_ids = data.get('user_ids')
+
+    if not user_ids or not isinstance(user_ids, list):
+        return jsonify({'error': 'VALIDATION', 'message': 'user_ids list is required'}), 400
+
+    service = UserService()
+    result = service.deactivate_users(user_ids)
+
+    if 'error' in result:
+        status_map = {'ACCESS_DENIED': 403, 'VALIDATION': 400}
+        return jsonify(result), status_map.get(result['error'], 500)
+
     return jsonify(result)
 
 
@@ -30,7 +30,11 @@ def get_import_status():
 @require_auth
 @require_tenant_access
 def get_schedules():
-    """Get all schedules for the tenant college"""
+    """Get all schedules for the tenant college.
+
+    Text filters (class_code, faculty, room) match exactly by default;
+    append '*' for a prefix search or use '%' for an explicit LIKE pattern.
+    """
     user = get_current_user()
     college_id = get_tenant_college_id()
     
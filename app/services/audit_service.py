@@ -9,6 +9,19 @@ from typing import Optional, Dict, List, Any
 from flask import current_app, request, g
 from sqlalchemy import text
 
+from ..utils.pagination import clamp_pagination
+
+
+def _as_text(value):
+    """old/new audit values land in TEXT columns; dicts and lists are
+    serialized to compact JSON here so call sites pass structures as-is
+    instead of pre-encoding (and Python repr never leaks into the log)"""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(',', ':'), default=str)
+    return str(value)
+
 
 class AuditService:
     """Service for system-wide auditing and security logging"""
@@ -16,58 +29,95 @@ class AuditService:
     def __init__(self, db_path: str = None):
         pass
 
+    _LOG_SQL = text("""
+        INSERT INTO audit_logs (
+            log_id, college_id, user_id, user_email, user_role,
+            action_type, entity_type, entity_id, entity_name,
+            old_value, new_value, change_summary,
+            ip_address, user_agent, request_path, request_method,
+            severity, created_at
+        ) VALUES (:lid, :cid, :uid, :uemail, :urole, :atype, :etype, :eid, :ename, :old, :new, :sum, :ip, :ua, :path, :meth, :sev, :now)
+    """)
+
+    def _build_params(self, action_type: str, entity_type: str, entity_id: str = None,
+                      entity_name: str = None, college_id: str = None, old_value: Any = None,
+                      new_value: Any = None, change_summary: str = None, severity: str = 'INFO',
+                      user_id: str = None, user_email: str = None, user_role: str = None) -> Dict:
+        """Resolve user/request context into bind params for one log row"""
+        user_ctx = getattr(g, 'current_user', {})
+        final_user_id = user_id or user_ctx.get('user_id')
+        final_college = college_id or user_ctx.get('college_id')
+        return {
+            "lid": uuid.uuid4(),
+            "cid": uuid.UUID(str(final_college)) if final_college else None,
+            "uid": uuid.UUID(str(final_user_id)) if final_user_id else None,
+            "uemail": user_email or user_ctx.get('email'),
+            "urole": user_role or user_ctx.get('role'), "atype": action_type,
+            "etype": entity_type,
+            "eid": uuid.UUID(str(entity_id)) if entity_id else None,
+            "ename": entity_name, "old": _as_text(old_value),
+            "new": _as_text(new_value), "sum": change_summary,
+            "ip": request.remote_addr if request else None,
+            "ua": request.user_agent.string if request else None,
+            "path": request.path if request else None,
+            "meth": request.method if request else None,
+            "sev": severity, "now": datetime.utcnow()
+        }
+
     def log(self, action_type: str, entity_type: str, entity_id: str = None,
             entity_name: str = None, college_id: str = None, old_value: Any = None,
             new_value: Any = None, change_summary: str = None, severity: str = 'INFO',
-            user_id: str = None, user_email: str = None, user_role: str = None) -> bool:
-        """Create a new audit log entry"""
-        try:
-            user_ctx = getattr(g, 'current_user', {})
-            final_user_id = user_id or user_ctx.get('user_id')
-            final_email = user_email or user_ctx.get('email')
-            final_role = user_role or user_ctx.get('role')
-            final_college = college_id or user_ctx.get('college_id')
-
-            req_info = {
-                'ip_address': request.remote_addr if request else None,
-                'user_agent': request.user_agent.string if request else None,
-                'request_path': request.path if request else None,
-                'request_method': request.method if request else None
-            }
+            user_id: str = None, user_email: str = None, user_role: str = None,
+            conn=None) -> bool:
+        """Create a new audit log entry.
 
-            db = current_app.extensions['sqlalchemy']
-            with db.engine.connect() as conn:
-                conn.execute(text("""
-                    INSERT INTO audit_logs (
-                        log_id, college_id, user_id, user_email, user_role,
-                        action_type, entity_type, entity_id, entity_name,
-                        old_value, new_value, change_summary,
-                        ip_address, user_agent, request_path, request_method,
-                        severity, created_at
-                    ) VALUES (:lid, :cid, :uid, :uemail, :urole, :atype, :etype, :eid, :ename, :old, :new, :sum, :ip, :ua, :path, :meth, :sev, :now)
-                """), {
-                    "lid": uuid.uuid4(),
-                    "cid": uuid.UUID(str(final_college)) if final_college else None,
-                    "uid": uuid.UUID(str(final_user_id)) if final_user_id else None,
-                    "uemail": final_email, "urole": final_role, "atype": action_type,
-                    "etype": entity_type, 
-                    "eid": uuid.UUID(str(entity_id)) if entity_id else None,
-                    "ename": entity_name, "old": str(old_value) if old_value else None,
-                    "new": str(new_value) if new_value else None, "sum": change_summary,
-                    "ip": req_info['ip_address'], "ua": req_info['user_agent'],
-                    "path": req_info['request_path'], "meth": req_info['request_method'],
-                    "sev": severity, "now": datetime.utcnow()
-                })
+        Pass `conn` to reuse the caller's open connection instead of checking
+        a second one out of the pool; the insert is committed on it directly.
+        """
+        try:
+            params = self._build_params(action_type, entity_type, entity_id, entity_name,
+                                        college_id, old_value, new_value, change_summary,
+                                        severity, user_id, user_email, user_role)
+            if conn is not None:
+                conn.execute(self._LOG_SQL, params)
                 conn.commit()
                 return True
+            db = current_app.extensions['sqlalchemy']
+            with db.engine.connect() as own_conn:
+                own_conn.execute(self._LOG_SQL, params)
+                own_conn.commit()
+                return True
         except Exception as e:
             current_app.logger.error(f"Audit log failed: {e}")
             return False
 
+    def enqueue(self, action_type: str, entity_type: str, entity_id: str = None,
+                entity_name: str = None, college_id: str = None, old_value: Any = None,
+                new_value: Any = None, change_summary: str = None, severity: str = 'INFO',
+                user_id: str = None, user_email: str = None, user_role: str = None) -> bool:
+        """Queue an audit row on flask.g instead of writing immediately.
+
+        flush_audit_queue (registered as an after_request hook) inserts all
+        queued rows with a single executemany and one commit, so a bulk
+        mutation pays one fsync for its whole audit trail.
+        """
+        try:
+            params = self._build_params(action_type, entity_type, entity_id, entity_name,
+                                        college_id, old_value, new_value, change_summary,
+                                        severity, user_id, user_email, user_role)
+            g.setdefault('_audit_queue', []).append(params)
+            return True
+        except Exception as e:
+            current_app.logger.error(f"Audit enqueue failed: {e}")
+            return False
+
+
     def get_logs(self, college_id: str = None, action_filter: str = None,
                  entity_filter: str = None, severity_filter: str = None,
                  page: int = 1, per_page: int = 50) -> Dict:
         """Fetch audit logs with filtering"""
+        page, per_page, page_err = clamp_pagination(page, per_page)
+        if page_err: return page_err
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             query_parts = ["FROM audit_logs WHERE 1=1"]
@@ -102,3 +152,17 @@ class AuditService:
                 ORDER BY created_at DESC LIMIT :limit
             """), {"limit": limit})
             return [dict(row._mapping) for row in res]
+
+
+def flush_audit_queue(response):
+    """after_request hook: flush all queued audit rows in one batch"""
+    queued = g.pop('_audit_queue', None)
+    if queued:
+        try:
+            db = current_app.extensions['sqlalchemy']
+            with db.engine.connect() as conn:
+                conn.execute(AuditService._LOG_SQL, queued)
+                conn.commit()
+        except Exception as e:
+            current_app.logger.error(f"Audit flush failed: {e}")
+    return response
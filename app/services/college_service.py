@@ -9,6 +9,8 @@ import uuid
 import json
 from sqlalchemy import text
 
+from ..utils.pagination import clamp_pagination
+
 
 class CollegeService:
     """Service for college management with RBAC enforcement"""
@@ -53,7 +55,10 @@ class CollegeService:
         
         if user['role'] != 'SUPER_ADMIN':
             return {'error': 'ACCESS_DENIED', 'message': 'Only Super Admin can view all colleges'}
-        
+
+        page, per_page, page_err = clamp_pagination(page, per_page)
+        if page_err: return page_err
+
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             # Build query
@@ -177,7 +182,7 @@ class CollegeService:
                     action='CREATE',
                     entity_type='college',
                     entity_id=college_id,
-                    new_value=json.dumps(data),
+                    new_value=data,
                     summary=f"Created college: {data['college_name']} with admin {admin_email}"
                 )
                 
@@ -224,8 +229,8 @@ class CollegeService:
                 
                 self._log_audit(
                     college_id=cid_uuid, action='APPROVE', entity_type='college', entity_id=cid_uuid,
-                    old_value=json.dumps({'status': row['status']}),
-                    new_value=json.dumps({'status': 'APPROVED'}),
+                    old_value={'status': row['status']},
+                    new_value={'status': 'APPROVED'},
                     summary=f"Approved college: {row['college_name']}"
                 )
                 return {'success': True}
@@ -317,7 +322,7 @@ class CollegeService:
                 conn.commit()
                 
                 self._log_audit(college_id=cid_uuid, action='UPDATE_BRANDING', entity_type='college', entity_id=cid_uuid,
-                                old_value=json.dumps(dict(row)), new_value=json.dumps(data), summary="Branding updated")
+                                old_value=dict(row), new_value=data, summary="Branding updated")
                 return {'success': True}
             except Exception as e:
                 conn.rollback()
@@ -3,14 +3,93 @@ CampusIQ - Schedule Service
 Production service for timetable management and CSV bulk imports
 """
 import csv
+import heapq
 import io
+import os
+import queue
 import re
+import threading
 import uuid
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from typing import Optional, Dict, List, Any
 from flask import current_app, g
 from sqlalchemy import text
 
+from ..utils.pagination import clamp_pagination
+
+# Matches "9", "9:30", "09:30:00", "9:30 PM" etc. in one pass
+_TIME_RE = re.compile(r'\s*(\d{1,2})(?::(\d{2}))?(?::\d{2})?\s*([AaPp][Mm])?\s*$')
+
+# Accepted CSV header spellings per logical field, in fallback order
+_CSV_FIELDS = {
+    'day': ('day', 'day_of_week', 'weekday', 'date'),
+    'time': ('time', 'timeslot', 'slot'),
+    'start': ('start_time', 'start', 'from', 'start_at'),
+    'end': ('end_time', 'end', 'to', 'end_at'),
+    'class': ('class_code', 'class', 'group', 'batch', 'division', 'year'),
+    'subject': ('subject_name', 'subject', 'course', 'module'),
+    'faculty': ('instructor_name', 'instructor', 'faculty', 'teacher', 'prof'),
+    'room': ('room_code', 'room', 'location', 'room_no', 'venue'),
+}
+
+# Day parsing tables built once; _parse_day runs per CSV row
+_DAY_RE = re.compile(r'day\s*(\d+)')
+_DAY_MAP = {'monday': 0, 'mon': 0, 'tuesday': 1, 'tue': 1, 'wednesday': 2, 'wed': 2,
+            'thursday': 3, 'thu': 3, 'friday': 4, 'fri': 4, 'saturday': 5, 'sat': 5,
+            'sunday': 6, 'sun': 6}
+
+# Hot-path statements built once at import so repeated calls reuse the same
+# construct (and SQLAlchemy's compiled cache) instead of re-parsing per call
+_ONGOING_SQL = text("""
+    SELECT * FROM schedules
+    WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0
+    AND start_time <= :time AND end_time > :time ORDER BY start_time
+""")
+_UPCOMING_SQL = text("""
+    SELECT * FROM schedules
+    WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0
+    AND start_time >= :time ORDER BY start_time LIMIT :limit
+""")
+_OVERLAP_SQL = ("SELECT * FROM schedules WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0"
+                " AND (start_time < :end AND end_time > :start)"
+                " AND ((:class IS NOT NULL AND class_code = :class)"
+                "   OR (:inst IS NOT NULL AND instructor_name = :inst)"
+                "   OR (:room IS NOT NULL AND room_code = :room))")
+_CONFLICT_SQL = text(_OVERLAP_SQL)
+_CONFLICT_EXCLUDE_SQL = text(_OVERLAP_SQL + " AND schedule_id != :exclude")
+_ROOM_STATUS_SQL = text("""
+    SELECT room_code, MAX(CASE WHEN day_of_week = :day AND start_time <= :time AND end_time > :time
+                               THEN class_code || ' - ' || subject_name END) AS busy_class
+    FROM schedules WHERE college_id = :cid AND is_deleted = 0
+    GROUP BY room_code
+""")
+_FACULTY_STATUS_SQL = text("""
+    SELECT instructor_name, MAX(CASE WHEN day_of_week = :day AND start_time <= :time AND end_time > :time
+                                     THEN class_code || ' - ' || subject_name END) AS busy_class
+    FROM schedules WHERE college_id = :cid AND is_deleted = 0
+    GROUP BY instructor_name
+""")
+_ALL_ROOMS_SQL = text("SELECT room_code FROM rooms WHERE college_id = :cid AND is_deleted = 0")
+_BUSY_ROOMS_SQL = text("SELECT DISTINCT room_code FROM schedules WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0 AND (start_time <= :time AND end_time > :time)")
+
+
+def _uuid4_stream(chunk: int = 512):
+    """Yield random UUIDs drawn from one urandom read per chunk, instead of a
+    16-byte getrandom syscall per value as uuid.uuid4() does."""
+    while True:
+        blob = os.urandom(16 * chunk)
+        for i in range(chunk):
+            yield uuid.UUID(bytes=blob[i * 16:(i + 1) * 16], version=4)
+
+
+def _rows_to_dicts(res) -> List[Dict]:
+    """Materialize a result set as plain dicts with a single keys() lookup
+    instead of building a per-row _mapping view first."""
+    cols = res.keys()
+    return [dict(zip(cols, row)) for row in res]
+
 
 class ScheduleService:
     """Service for schedule management with multi-tenant isolation"""
@@ -25,10 +104,25 @@ class ScheduleService:
             return {'role': None, 'user_id': None, 'college_id': None}
         return user
 
+    def _fts_available(self, conn) -> bool:
+        """True when the SQLite FTS5 shadow table for schedules exists.
+
+        Non-SQLite backends (Oracle/Postgres) keep the portable LIKE path.
+        """
+        if conn.dialect.name != 'sqlite':
+            return False
+        try:
+            row = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schedules_fts'")).fetchone()
+            return row is not None
+        except Exception:
+            return False
+
     def get_schedules(self, college_id: str, day_of_week: Optional[int] = None,
                       class_code: Optional[str] = None, faculty_name: Optional[str] = None,
                       room_code: Optional[str] = None, page: int = 1, per_page: int = 50) -> Dict:
         """Get schedules with filtering and pagination"""
+        page, per_page, page_err = clamp_pagination(page, per_page)
+        if page_err: return page_err
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             cid_uuid = uuid.UUID(str(college_id))
@@ -38,24 +132,50 @@ class ScheduleService:
             if day_of_week is not None:
                 query_parts.append("AND day_of_week = :day")
                 params["day"] = day_of_week
-            if class_code:
-                query_parts.append("AND class_code LIKE :class")
-                params["class"] = f"%{class_code}%"
-            if faculty_name:
-                query_parts.append("AND instructor_name LIKE :faculty")
-                params["faculty"] = f"%{faculty_name}%"
-            if room_code:
-                query_parts.append("AND room_code LIKE :room")
-                params["room"] = f"%{room_code}%"
-            
+
+            # Wildcard-free filters take the indexed equality fast path;
+            # 'foo*' becomes a prefix search (FTS5 when available, LIKE
+            # otherwise) and explicit '%' patterns pass through as LIKE
+            wildcard_filters = []
+            for col, pname, val in (("class_code", "class", class_code),
+                                    ("instructor_name", "faculty", faculty_name),
+                                    ("room_code", "room", room_code)):
+                if not val: continue
+                s = str(val)
+                if '*' in s or '%' in s:
+                    wildcard_filters.append((col, pname, s))
+                else:
+                    query_parts.append(f"AND {col} = :{pname}")
+                    params[pname] = s
+
+            if wildcard_filters:
+                prefix_only = all('%' not in s and '*' not in s[:-1] and s.endswith('*') for _, _, s in wildcard_filters)
+                if prefix_only and self._fts_available(conn):
+                    terms = [f'{col}:"{s[:-1].replace(chr(34), chr(34) * 2)}"*' for col, _, s in wildcard_filters]
+                    query_parts.append("AND rowid IN (SELECT rowid FROM schedules_fts WHERE schedules_fts MATCH :match)")
+                    params["match"] = " AND ".join(terms)
+                else:
+                    for col, pname, s in wildcard_filters:
+                        query_parts.append(f"AND {col} LIKE :{pname}")
+                        params[pname] = s.replace('*', '%')
+
             base_q = " ".join(query_parts)
-            total = conn.execute(text(f"SELECT COUNT(*) {base_q}"), params).fetchone()[0]
-            
             params.update({"limit": per_page, "offset": (page - 1) * per_page})
-            res = conn.execute(text(f"SELECT * {base_q} ORDER BY day_of_week, start_time LIMIT :limit OFFSET :offset"), params)
-            
+            # COUNT(*) OVER() rides along on each row, so one query serves
+            # both the page and the total
+            res = conn.execute(text(f"SELECT *, COUNT(*) OVER() AS _total {base_q} ORDER BY day_of_week, start_time LIMIT :limit OFFSET :offset"), params)
+            items = _rows_to_dicts(res)
+            if items:
+                total = items[0]['_total']
+                for item in items: del item['_total']
+            elif page > 1:
+                # Paged past the end - fall back to a count for an accurate total
+                total = conn.execute(text(f"SELECT COUNT(*) {base_q}"), params).fetchone()[0]
+            else:
+                total = 0
+
             return {
-                'items': [dict(row._mapping) for row in res], 'total': total,
+                'items': items, 'total': total,
                 'page': page, 'per_page': per_page, 'pages': (total + per_page - 1) // per_page if per_page > 0 else 1
             }
 
@@ -65,22 +185,14 @@ class ScheduleService:
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             cid_uuid = uuid.UUID(str(college_id))
-            on_res = conn.execute(text("""
-                SELECT * FROM schedules 
-                WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0
-                AND start_time <= :time AND end_time > :time ORDER BY start_time
-            """), {"cid": cid_uuid, "day": day, "time": time})
-            ongoing = [dict(row._mapping) for row in on_res]
+            on_res = conn.execute(_ONGOING_SQL, {"cid": cid_uuid, "day": day, "time": time})
+            ongoing = _rows_to_dicts(on_res)
             
             needed = limit - len(ongoing)
             upcoming = []
             if needed > 0:
-                up_res = conn.execute(text("""
-                    SELECT * FROM schedules 
-                    WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0
-                    AND start_time >= :time ORDER BY start_time LIMIT :limit
-                """), {"cid": cid_uuid, "day": day, "time": time, "limit": needed})
-                upcoming = [dict(row._mapping) for row in up_res]
+                up_res = conn.execute(_UPCOMING_SQL, {"cid": cid_uuid, "day": day, "time": time, "limit": needed})
+                upcoming = _rows_to_dicts(up_res)
             
             return ongoing + upcoming
 
@@ -143,15 +255,18 @@ class ScheduleService:
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             cid_uuid = uuid.UUID(str(college_id))
-            query = "SELECT * FROM schedules WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0 AND (start_time < :end AND end_time > :start)"
-            params = {"cid": cid_uuid, "day": day_of_week, "end": end_time, "start": start_time}
+            query = _CONFLICT_SQL
+            # Entity equality runs in SQL, so only true conflicts come back;
+            # the loop below just labels them
+            params = {"cid": cid_uuid, "day": day_of_week, "end": end_time, "start": start_time,
+                      "class": class_code, "inst": instructor_name, "room": room_code}
             if exclude_id:
-                query += " AND schedule_id != :exclude"
+                query = _CONFLICT_EXCLUDE_SQL
                 params["exclude"] = uuid.UUID(str(exclude_id))
-            
-            res = conn.execute(text(query), params)
-            overlaps = [dict(row._mapping) for row in res]
-            
+
+            res = conn.execute(query, params)
+            overlaps = _rows_to_dicts(res)
+
             conflicts = []
             for o in overlaps:
                 if class_code and o['class_code'] == class_code:
@@ -162,34 +277,106 @@ class ScheduleService:
                     conflicts.append({'type': 'ROOM_CONFLICT', 'message': f"Room {room_code} is busy", 'entry': o})
             return conflicts
 
+    def check_conflicts_bulk(self, college_id: str, candidates: List[Dict]) -> List[Dict]:
+        """Check many candidate schedules for conflicts in a single query.
+
+        Each candidate dict uses the same keys as check_conflicts (day_of_week,
+        start_time, end_time, class_code, instructor_name, room_code). Returns
+        the same conflict dicts with an extra 'index' pointing back at the
+        candidate, so a batch validator does one round trip instead of N.
+        """
+        if not candidates:
+            return []
+        db = current_app.extensions['sqlalchemy']
+        with db.engine.connect() as conn:
+            cid_uuid = uuid.UUID(str(college_id))
+            values, params = [], {"cid": cid_uuid}
+            for i, cand in enumerate(candidates):
+                values.append(f"(:i{i}, :d{i}, :s{i}, :e{i}, :c{i}, :f{i}, :r{i})")
+                params.update({
+                    f"i{i}": i, f"d{i}": cand.get('day_of_week'),
+                    f"s{i}": cand.get('start_time'), f"e{i}": cand.get('end_time'),
+                    f"c{i}": cand.get('class_code'), f"f{i}": cand.get('instructor_name'),
+                    f"r{i}": cand.get('room_code')
+                })
+            query = f"""
+                WITH cand(idx, day, start_t, end_t, cls, inst, room) AS (VALUES {', '.join(values)})
+                SELECT c.idx AS cand_idx, c.cls AS cand_cls, c.inst AS cand_inst, c.room AS cand_room, s.*
+                FROM cand c JOIN schedules s
+                  ON s.college_id = :cid AND s.is_deleted = 0 AND s.day_of_week = c.day
+                  AND s.start_time < c.end_t AND s.end_time > c.start_t
+                WHERE (c.cls IS NOT NULL AND s.class_code = c.cls)
+                   OR (c.inst IS NOT NULL AND s.instructor_name = c.inst)
+                   OR (c.room IS NOT NULL AND s.room_code = c.room)
+            """
+            res = conn.execute(text(query), params)
+            cols = res.keys()
+
+            conflicts = []
+            for row in res:
+                m = dict(zip(cols, row))
+                entry = {k: v for k, v in m.items() if not k.startswith('cand_')}
+                idx = m['cand_idx']
+                if m['cand_cls'] and entry['class_code'] == m['cand_cls']:
+                    conflicts.append({'index': idx, 'type': 'CLASS_CONFLICT', 'message': f"Class {m['cand_cls']} is busy", 'entry': entry})
+                if m['cand_inst'] and entry['instructor_name'] == m['cand_inst']:
+                    conflicts.append({'index': idx, 'type': 'FACULTY_CONFLICT', 'message': f"Instructor {m['cand_inst']} is busy", 'entry': entry})
+                if m['cand_room'] and entry['room_code'] == m['cand_room']:
+                    conflicts.append({'index': idx, 'type': 'ROOM_CONFLICT', 'message': f"Room {m['cand_room']} is busy", 'entry': entry})
+            return conflicts
+
+    def _detect_batch_conflicts(self, entries) -> List[str]:
+        """Sweep-line over (row_no, insert params) pairs to flag overlaps
+        inside an import batch without touching the database.
+
+        Rows are grouped by day and walked in start-time order with a min-heap
+        of still-active end times, so each row is only compared against rows it
+        actually overlaps.
+        """
+        warnings = []
+        by_day = {}
+        for row_no, p in entries:
+            by_day.setdefault(p['day'], []).append((p['start'], p['end'], row_no, p))
+
+        for items in by_day.values():
+            items.sort(key=lambda e: e[0])
+            active = []  # (end_time, row_no, params) min-heap
+            for start, end, row_no, p in items:
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for _, other_no, o in active:
+                    if p['class'] and o['class'] == p['class']:
+                        warnings.append(f"Row {row_no}: class {p['class']} overlaps row {other_no}")
+                    elif p['inst'] and o['inst'] == p['inst']:
+                        warnings.append(f"Row {row_no}: instructor {p['inst']} overlaps row {other_no}")
+                    elif p['room'] and o['room'] == p['room']:
+                        warnings.append(f"Row {row_no}: room {p['room']} overlaps row {other_no}")
+                heapq.heappush(active, (end, row_no, p))
+        return warnings
+
     def import_from_csv(self, file_storage, college_id: str, imported_by: str) -> Dict:
         """Bulk import schedules from CSV file"""
         try:
-            # Use .read() which is safer than .stream.read()
-            raw_data = file_storage.read()
-            if not raw_data:
+            # Peek the head for emptiness/delimiter checks, then stream the
+            # body through a TextIOWrapper so the upload is never fully
+            # buffered (bytes + str + StringIO copies) in memory
+            stream = file_storage.stream
+            head = stream.read(8192)
+            if not head:
                 return {'imported': 0, 'skipped': 0, 'errors': ["File is empty"]}
-                
-            try: content = raw_data.decode("utf-8-sig")
-            except UnicodeDecodeError: 
-                try: content = raw_data.decode("utf-8")
-                except UnicodeDecodeError: content = raw_data.decode("latin-1")
-            
-            stream = io.StringIO(content, newline=None)
-            # Try to detect delimiter and handle TSV
-            sample = content[:4096]
-            dialect = 'excel'
-            if sample:
-                try:
-                    # Check for tab separation which is common in some exports
-                    if '\t' in sample and sample.count('\t') > sample.count(','):
-                        dialect = 'excel-tab'
-                    else:
-                        sniffer = csv.Sniffer()
-                        dialect = sniffer.sniff(sample)
-                except: dialect = 'excel'
-            
-            reader = csv.DictReader(stream, dialect=dialect)
+            stream.seek(0)
+
+            try: first_line = head.decode("utf-8-sig").split('\n', 1)[0]
+            except UnicodeDecodeError: first_line = head.decode("latin-1").split('\n', 1)[0]
+            # Detect delimiter from the header line only - one bounded scan
+            # instead of counting candidates over the whole payload
+            delimiter = ','
+            if first_line:
+                try: delimiter = csv.Sniffer().sniff(first_line, delimiters=',;\t|').delimiter
+                except csv.Error: delimiter = max(',;\t|', key=first_line.count)
+
+            text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline='')
+            reader = csv.reader(text_stream, delimiter=delimiter)
         except Exception as e: 
             current_app.logger.error(f"CSV Parse Error: {e}")
             return {'imported': 0, 'skipped': 0, 'errors': [f"File read error: {str(e)}"]}
@@ -220,100 +407,135 @@ class ScheduleService:
             try:
                 cid_uuid = uuid.UUID(str(college_id))
                 uby_uuid = uuid.UUID(str(imported_by))
-                now = datetime.utcnow()
-                
-                # phase 2: Load rows
-                first_row = next(reader, None)
-                if first_row:
-                    # Log detected columns for debugging
-                    keys = [str(k).lower().strip().replace(' ', '_') for k in first_row.keys() if k]
-                    current_app.logger.info(f"CSV Headers detected: {keys}")
-                    rows = [first_row] + list(reader)
-                else:
+                # One ISO string for the whole batch: binding a str skips the
+                # per-row datetime adapter conversion during executemany
+                now = datetime.utcnow().isoformat(sep=' ')
+                uuid_gen = _uuid4_stream()
+
+                # phase 2: Stream rows. Column positions are resolved once from
+                # the header, so the row loop does list indexing instead of
+                # rebuilding a normalized dict per row
+                header = next(reader, None)
+                first_row = next(reader, None) if header else None
+                if first_row is None:
                     return {'imported': 0, 'skipped': 0, 'errors': ["CSV has no data rows"]}
 
-                current_app.logger.info(f"Starting import of {len(rows)} rows for college {college_id}")
+                keys = [str(k).lower().strip().replace(' ', '_').replace('(', '').replace(')', '') for k in header]
+                current_app.logger.info(f"CSV Headers detected: {keys}")
+                col_idx = {k: i for i, k in enumerate(keys) if k}
+                field_idx = {field: [col_idx[n] for n in names if n in col_idx]
+                             for field, names in _CSV_FIELDS.items()}
 
-                # Update total
-                conn.execute(text("UPDATE import_progress SET total_rows = :total, message = 'Processing data...' WHERE college_id = :cid"), 
-                                {"cid": cid_uuid, "total": len(rows)})
-                conn.commit()
-                
-                all_params = []
-                for row_idx, row in enumerate(rows):
-                    try:
-                        # Safely handle None keys or non-string keys
-                        data = {}
-                        for k, v in row.items():
-                            if k:
-                                clean_k = str(k).lower().strip().replace(' ', '_').replace('(', '').replace(')', '')
-                                data[clean_k] = v
-                        
-                        day_val = data.get('day') or data.get('day_of_week') or data.get('weekday') or data.get('date')
-                        day = self._parse_day(day_val)
-                        
-                        time_val = data.get('time') or data.get('timeslot') or data.get('slot')
-                        if time_val and '-' in str(time_val):
-                            t_parts = str(time_val).split('-')
-                            start_val = t_parts[0].strip()
-                            end_val = t_parts[1].strip()
-                        else:
-                            start_val = data.get('start_time') or data.get('start') or data.get('from') or data.get('start_at')
-                            end_val = data.get('end_time') or data.get('end') or data.get('to') or data.get('end_at')
-                            
-                        # Handle cases where From/To are like "9:00" without AM/PM but To is "5:00 PM"
-                        start = self._normalize_time(start_val)
-                        end = self._normalize_time(end_val)
-                        
-                        class_code = data.get('class_code') or data.get('class') or data.get('group') or data.get('batch') or data.get('division') or data.get('year')
-                        subject = data.get('subject_name') or data.get('subject') or data.get('course') or data.get('module')
-                        faculty = data.get('instructor_name') or data.get('instructor') or data.get('faculty') or data.get('teacher') or data.get('prof')
-                        room = data.get('room_code') or data.get('room') or data.get('location') or data.get('room_no') or data.get('venue')
-                        
-                        # Strip quotes from room names like "J-104A1"
-                        if room: room = str(room).strip('"\' ')
-                        
-                        if day is None or not start or not end or not class_code:
-                            missing = []
-                            if day is None: missing.append(f"day(val:{day_val})")
-                            if not start or start == "00:00": missing.append("start")
-                            if not end or end == "00:00": missing.append("end")
-                            if not class_code: missing.append("group/class")
-                            errors.append(f"Row {row_idx + 1}: Missing {', '.join(missing)}")
-                            skipped += 1; continue
-                        
-                        all_params.append({
-                            "sid": uuid.uuid4(), "cid": cid_uuid, "class": str(class_code), "sub": str(subject or ''),
-                            "inst": str(faculty or ''), "room": str(room or ''), "day": int(day), "start": str(start), "end": str(end),
-                            "cby": uby_uuid, "now": now
-                        })
-                    except Exception as e:
-                        errors.append(f"Row {row_idx + 1}: {str(e)}")
-                        skipped += 1
-                
-                # phase 3: Batch Insert
+                def cell(row, field):
+                    for i in field_idx[field]:
+                        if i < len(row) and row[i]:
+                            return row[i]
+                    return None
+
+                rows = chain([first_row], reader)
+                current_app.logger.info(f"Starting streaming import for college {college_id}")
+
+                # phase 3: pipelined parse + insert. A parser thread fills a
+                # bounded queue of row batches while this thread drains it with
+                # executemany, overlapping decode/validate with the write I/O.
+                # The SQLAlchemy connection stays on this thread only - SQLite
+                # connections are thread-affine
                 chunk_size = 500
-                for i in range(0, len(all_params), chunk_size):
-                    chunk = all_params[i:i + chunk_size]
+                batch_q = queue.Queue(maxsize=8)
+
+                def _parse_rows():
+                    nonlocal skipped
+                    batch = []
+                    try:
+                        for row_idx, row in enumerate(rows):
+                            try:
+                                day_val = cell(row, 'day')
+                                day = self._parse_day(day_val)
+
+                                time_val = cell(row, 'time')
+                                if time_val and '-' in str(time_val):
+                                    t_parts = str(time_val).split('-')
+                                    start_val = t_parts[0].strip()
+                                    end_val = t_parts[1].strip()
+                                else:
+                                    start_val = cell(row, 'start')
+                                    end_val = cell(row, 'end')
+
+                                # Handle cases where From/To are like "9:00" without AM/PM but To is "5:00 PM"
+                                start = self._normalize_time(start_val)
+                                end = self._normalize_time(end_val)
+
+                                class_code = cell(row, 'class')
+                                subject = cell(row, 'subject')
+                                faculty = cell(row, 'faculty')
+                                room = cell(row, 'room')
+
+                                # Strip quotes from room names like "J-104A1"
+                                if room: room = str(room).strip('"\' ')
+
+                                if day is None or not start or not end or not class_code:
+                                    missing = []
+                                    if day is None: missing.append(f"day(val:{day_val})")
+                                    if not start or start == "00:00": missing.append("start")
+                                    if not end or end == "00:00": missing.append("end")
+                                    if not class_code: missing.append("group/class")
+                                    errors.append(f"Row {row_idx + 1}: Missing {', '.join(missing)}")
+                                    skipped += 1; continue
+
+                                batch.append((row_idx + 1, {
+                                    "sid": next(uuid_gen), "cid": cid_uuid, "class": str(class_code), "sub": str(subject or ''),
+                                    "inst": str(faculty or ''), "room": str(room or ''), "day": int(day), "start": str(start), "end": str(end),
+                                    "cby": uby_uuid, "now": now
+                                }))
+                                if len(batch) >= chunk_size:
+                                    batch_q.put(batch)
+                                    batch = []
+                            except Exception as e:
+                                errors.append(f"Row {row_idx + 1}: {str(e)}")
+                                skipped += 1
+                    finally:
+                        if batch: batch_q.put(batch)
+                        batch_q.put(None)
+
+                parser = threading.Thread(target=_parse_rows, name='csv-import-parse', daemon=True)
+                parser.start()
+
+                parsed, batch_no = [], 0
+                while True:
+                    batch = batch_q.get()
+                    if batch is None: break
+                    batch_no += 1
+                    chunk = [p for _, p in batch]
                     batch_trans = conn.begin()
                     try:
                         conn.execute(text("""
                             INSERT INTO schedules (
-                                schedule_id, college_id, class_code, subject_name, instructor_name, room_code, 
+                                schedule_id, college_id, class_code, subject_name, instructor_name, room_code,
                                 day_of_week, start_time, end_time, created_by, created_at, updated_at
                             ) VALUES (:sid, :cid, :class, :sub, :inst, :room, :day, :start, :end, :cby, :now, :now)
                         """), chunk)
                         batch_trans.commit()
                         imported += len(chunk)
-                        
+
                         # Update progress using same connection
-                        conn.execute(text("UPDATE import_progress SET processed_rows = :proc, message = :msg WHERE college_id = :cid"), 
-                                        {"cid": cid_uuid, "proc": imported, "msg": f"Saving {imported}/{len(all_params)}..."})
+                        conn.execute(text("UPDATE import_progress SET processed_rows = :proc, message = :msg WHERE college_id = :cid"),
+                                        {"cid": cid_uuid, "proc": imported, "msg": f"Saving {imported}..."})
                         conn.commit()
-                        current_app.logger.info(f"Progress: {imported}/{len(all_params)} rows imported...")
+                        current_app.logger.info(f"Progress: {imported} rows imported...")
                     except Exception as e:
                         batch_trans.rollback()
-                        errors.append(f"Batch {i//chunk_size + 1} failure: {str(e)}")
+                        errors.append(f"Batch {batch_no} failure: {str(e)}")
+                    parsed.extend(batch)
+                parser.join()
+
+                # Intra-batch conflict sweep: one O(N log N) pass in Python
+                # instead of a check_conflicts round trip per row
+                errors.extend(self._detect_batch_conflicts(parsed))
+
+                # Row count is only known once the stream is exhausted
+                conn.execute(text("UPDATE import_progress SET total_rows = :total WHERE college_id = :cid"),
+                             {"cid": cid_uuid, "total": len(parsed) + skipped})
+                conn.commit()
 
                 # phase 4: Cleanup
                 conn.execute(text("UPDATE import_progress SET status = 'idle', message = 'Complete!', processed_rows = total_rows WHERE college_id = :cid"), {"cid": cid_uuid})
@@ -345,66 +567,72 @@ class ScheduleService:
                 'message': res[3]
             }
 
-    def _normalize_time(self, time_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _normalize_time(time_str: str) -> str:
         if not time_str: return "00:00"
-        t = time_str.upper().strip()
-        is_pm, is_am = 'PM' in t, 'AM' in t
-        t = t.replace('AM', '').replace('PM', '').strip()
-        try:
-            if ':' in t:
-                parts = t.split(':')
-                h, m = int(parts[0]), int(parts[1][:2])
-            else: h, m = int(t), 0
-            if is_pm and h < 12: h += 12
-            if is_am and h == 12: h = 0
-            return f"{h:02d}:{m:02d}"
-        except: return time_str
-
-    def _parse_day(self, day_str: Optional[str]) -> Optional[int]:
+        s = str(time_str)
+        # Fast path: already-normalized "HH:MM" skips the regex entirely
+        if len(s) == 5 and s[2] == ':' and s[:2].isdigit() and s[3:].isdigit():
+            return s
+        m = _TIME_RE.match(s)
+        if not m: return time_str
+        h, mm, ampm = int(m[1]), int(m[2] or 0), m[3]
+        if ampm:
+            if ampm[0] in 'Pp' and h < 12: h += 12
+            elif ampm[0] in 'Aa' and h == 12: h = 0
+        return f"{h:02d}:{mm:02d}"
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_day(day_str: Optional[str]) -> Optional[int]:
         if not day_str: return None
         d = str(day_str).lower().strip()
         
         # Handle "Day 1", "Day 2" formats
-        day_match = re.search(r'day\s*(\d+)', d)
+        day_match = _DAY_RE.search(d)
         if day_match:
             try:
                 # Map Day 1 -> Mon (0), Day 2 -> Tue (1), etc.
                 return (int(day_match.group(1)) - 1) % 7
             except: pass
 
-        mapping = {'monday': 0, 'mon': 0, 'tuesday': 1, 'tue': 1, 'wednesday': 2, 'wed': 2, 'thursday': 3, 'thu': 3, 'friday': 4, 'fri': 4, 'saturday': 5, 'sat': 5, 'sunday': 6, 'sun': 6}
-        try: return mapping.get(d) if d in mapping else int(d) % 7
+        try: return _DAY_MAP.get(d) if d in _DAY_MAP else int(d) % 7
         except: return None
 
     def get_free_rooms(self, college_id: str, day: int, time: str) -> List[str]:
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             cid_uuid = uuid.UUID(str(college_id))
-            res_all = conn.execute(text("SELECT room_code FROM rooms WHERE college_id = :cid AND is_deleted = 0"), {"cid": cid_uuid})
+            res_all = conn.execute(_ALL_ROOMS_SQL, {"cid": cid_uuid})
             all_rooms = [row[0] for row in res_all]
-            res_busy = conn.execute(text("SELECT DISTINCT room_code FROM schedules WHERE college_id = :cid AND day_of_week = :day AND is_deleted = 0 AND (start_time <= :time AND end_time > :time)"), {"cid": cid_uuid, "day": day, "time": time})
-            busy_rooms = [row[0] for row in res_busy]
+            res_busy = conn.execute(_BUSY_ROOMS_SQL, {"cid": cid_uuid, "day": day, "time": time})
+            busy_rooms = {row[0] for row in res_busy}
+            if not busy_rooms:
+                return all_rooms
             return [r for r in all_rooms if r not in busy_rooms]
 
     def get_current_status(self, college_id: str, day: int, time: str) -> Dict:
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
-            cid_uuid = uuid.UUID(str(college_id))
-            res_f = conn.execute(text("SELECT DISTINCT instructor_name FROM schedules WHERE college_id = :cid AND is_deleted = 0"), {"cid": cid_uuid})
-            all_faculty = [{"name": r[0], "status": "FREE"} for r in res_f if r[0]]
-            res_r = conn.execute(text("SELECT DISTINCT room_code FROM schedules WHERE college_id = :cid AND is_deleted = 0"), {"cid": cid_uuid})
-            all_rooms = [{"code": r[0], "status": "FREE"} for r in res_r if r[0]]
-            
-            busy_q = "AND day_of_week = :day AND is_deleted = 0 AND (start_time <= :time AND end_time > :time)"
-            bus_r = conn.execute(text(f"SELECT room_code, class_code, subject_name FROM schedules WHERE college_id = :cid {busy_q}"), {"cid": cid_uuid, "day": day, "time": time})
-            busy_rooms_map = {r[0]: f"{r[1]} - {r[2]}" for r in bus_r}
-            bus_f = conn.execute(text(f"SELECT instructor_name, class_code, subject_name FROM schedules WHERE college_id = :cid {busy_q}"), {"cid": cid_uuid, "day": day, "time": time})
-            busy_fac_map = {r[0]: f"{r[1]} - {r[2]}" for r in bus_f}
-
-            for r in all_rooms:
-                if r['code'] in busy_rooms_map: r['status'], r['current_class'] = "BUSY", busy_rooms_map[r['code']]
-            for f in all_faculty:
-                if f['name'] in busy_fac_map: f['status'], f['current_class'] = "BUSY", busy_fac_map[f['name']]
+            params = {"cid": uuid.UUID(str(college_id)), "day": day, "time": time}
+
+            # One grouped query per entity: each row carries its busy class (or
+            # NULL) so no Python-side merge of separate busy/free result sets
+            all_rooms = []
+            for code, busy_class in conn.execute(_ROOM_STATUS_SQL, params):
+                if not code: continue
+                room = {"code": code, "status": "BUSY" if busy_class else "FREE"}
+                if busy_class: room["current_class"] = busy_class
+                all_rooms.append(room)
+
+            all_faculty = []
+            for name, busy_class in conn.execute(_FACULTY_STATUS_SQL, params):
+                if not name: continue
+                fac = {"name": name, "status": "BUSY" if busy_class else "FREE"}
+                if busy_class: fac["current_class"] = busy_class
+                all_faculty.append(fac)
+
             return {"rooms": all_rooms, "faculty": all_faculty, "timestamp": time, "day_index": day}
 
     def get_stats(self, college_id: str) -> Dict:
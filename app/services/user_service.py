@@ -3,60 +3,274 @@ CampusIQ - User Service
 User management with role validation and tenant isolation
 """
 from datetime import datetime
+from itertools import combinations
 from typing import Optional, Dict, List, Any
-from flask import current_app, g
+from flask import current_app, g, has_request_context
+import base64
+import threading
+import time
 import uuid
 import json
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import IntegrityError
+
+from ..middleware.rbac_middleware import validate_role_change
+from ..utils.pagination import clamp_pagination
+from .audit_service import AuditService
+
+# AuditService is stateless, so one module-level instance serves every write
+# path instead of re-importing and re-instantiating inside _log_audit
+_AUDIT = AuditService()
+
+# Constant statements are compiled to text() once at import instead of per
+# call; the dynamically assembled ones (get_users filters, the profile SET
+# clause) stay inline or go through the cached builder below
+_PROFILE_SQL = text("""
+    SELECT u.user_id, u.email, u.full_name, u.first_name, u.last_name,
+           u.avatar_url, u.phone, u.status, u.email_verified,
+           u.last_login_at, u.college_id,
+           r.role_code, r.role_name,
+           c.college_name, c.college_logo_url
+    FROM users u
+    JOIN roles r ON u.role_id = r.role_id
+    LEFT JOIN colleges c ON u.college_id = c.college_id
+    WHERE u.user_id = :uid AND u.is_deleted = 0
+""")
+# Total and per-role counts in one statement (NULL role_code row = total);
+# SQLite has no GROUPING SETS, so the two aggregations ride one UNION ALL
+_STATS_SQL = text("""
+    SELECT NULL AS role_code, COUNT(*) FROM users
+    WHERE is_deleted = 0 AND (:cid IS NULL OR college_id = :cid)
+    UNION ALL
+    SELECT r.role_code, COUNT(*) FROM users u JOIN roles r ON u.role_id = r.role_id
+    WHERE u.is_deleted = 0 AND (:cid IS NULL OR u.college_id = :cid)
+      AND r.role_code IN ('FACULTY', 'STAFF', 'STUDENT')
+    GROUP BY r.role_code
+""")
+_ROLES_SQL = text("SELECT role_id, role_code, role_name, hierarchy_level FROM roles")
+_COLLEGES_SQL = text("SELECT college_id, college_name FROM colleges")
+# Insert and reactivate in one statement: a soft-deleted or INACTIVE row
+# with the same email is revived in place, an active row blocks the upsert
+# (no row returned), and a fresh email inserts. Emails are normalised to
+# lower case before binding, so the plain UNIQUE(email) is the conflict
+# target; the upsert is atomic, unlike the old SELECT-then-INSERT pair.
+_UPSERT_USER_SQL = text("""
+    INSERT INTO users (user_id, email, full_name, role_id, college_id, status, created_by, created_at, updated_at)
+    VALUES (:uid, :email, :name, :rid, :cid, 'ACTIVE', :uby, :now, :now)
+    ON CONFLICT (email) DO UPDATE SET
+        full_name = excluded.full_name, role_id = excluded.role_id,
+        college_id = excluded.college_id, status = 'ACTIVE', is_deleted = 0,
+        updated_by = excluded.created_by, updated_at = excluded.updated_at
+    WHERE users.is_deleted = 1 OR users.status = 'INACTIVE'
+    RETURNING user_id
+""")
+_TARGET_ROLE_SQL = text("SELECT u.college_id, r.role_code FROM users u JOIN roles r ON u.role_id = r.role_id WHERE u.user_id = :uid AND u.is_deleted = 0")
+# role_id = :cur_rid is an optimistic guard: validate_role_change ran against
+# the role read above, so if a concurrent request changed it in between the
+# UPDATE matches nothing instead of applying a decision based on stale data
+_UPDATE_ROLE_SQL = text("""
+    UPDATE users SET role_id = :rid, college_id = :cid, updated_by = :uby, updated_at = :now
+    WHERE user_id = :uid AND is_deleted = 0 AND role_id = :cur_rid
+      AND (:role != 'COLLEGE_ADMIN' OR college_id = :acid)
+""")
+_DEACTIVATE_SQL = text("""
+    UPDATE users SET status = 'INACTIVE', updated_by = :uby, updated_at = :now
+    WHERE user_id = :uid AND is_deleted = 0 AND (:role != 'COLLEGE_ADMIN' OR college_id = :acid)
+""")
+# Bulk variants: expanding IN binds render one placeholder per id, which is
+# portable across sqlite and Postgres (ANY(:uids) is Postgres-only)
+_DEACTIVATE_MANY_SQL = text("""
+    UPDATE users SET status = 'INACTIVE', updated_by = :uby, updated_at = :now
+    WHERE user_id IN :uids AND is_deleted = 0 AND (:role != 'COLLEGE_ADMIN' OR college_id = :acid)
+""").bindparams(bindparam('uids', expanding=True))
+_TARGET_ROLES_MANY_SQL = text("""
+    SELECT u.user_id, u.college_id, r.role_code FROM users u JOIN roles r ON u.role_id = r.role_id
+    WHERE u.user_id IN :uids AND u.is_deleted = 0
+""").bindparams(bindparam('uids', expanding=True))
+_STATS_BULK_SQL = text("""
+    SELECT u.college_id, r.role_code, COUNT(*) FROM users u JOIN roles r ON u.role_id = r.role_id
+    WHERE u.is_deleted = 0 AND u.college_id IN :cids
+      AND r.role_code IN ('FACULTY', 'STAFF', 'STUDENT')
+    GROUP BY u.college_id, r.role_code
+""").bindparams(bindparam('cids', expanding=True))
+
+
+# Field projection for the users listing: callers may request any subset of
+# these. role/college names are merged from the in-process catalogs; the rest
+# read straight off the users table. One (select list, key tuple, flags)
+# shape is memoized per distinct subset so the SQL string - and therefore the
+# compiled-cache entry - stays stable across calls.
+_LIST_FIELDS = frozenset(('user_id', 'email', 'full_name', 'status', 'last_login_at',
+                          'role_code', 'role_name', 'college_name'))
+_LIST_DB_COLS = ('user_id', 'email', 'full_name', 'status', 'last_login_at')
+_LIST_SHAPES: Dict[frozenset, tuple] = {}
+
+
+def _list_shape(requested: frozenset) -> tuple:
+    """fields subset -> (select_cols, row keys, need_role, need_college)"""
+    shape = _LIST_SHAPES.get(requested)
+    if shape is None:
+        need_role = bool(requested & {'role_code', 'role_name'})
+        need_college = 'college_name' in requested
+        cols = [c for c in _LIST_DB_COLS if c in requested]
+        if need_role: cols.append('role_id')
+        if need_college: cols.append('college_id')
+        shape = (", ".join(f"u.{c}" for c in cols), tuple(cols), need_role, need_college)
+        _LIST_SHAPES[requested] = shape
+    return shape
+
+# Allowed profile fields per caller tier, built once instead of per call
+_PROFILE_FIELDS = frozenset(('full_name', 'first_name', 'last_name', 'phone'))
+_ADMIN_PROFILE_FIELDS = _PROFILE_FIELDS | {'status'}
+
+# Every legal SET-clause variant (31 for 5 fields) is precompiled at import,
+# keyed by the frozenset of fields being updated - zero string building on
+# the hot path and stable SQLAlchemy statement-cache hits
+_UPDATE_STMTS = {
+    frozenset(subset): text(
+        "UPDATE users SET " + ", ".join(f"{c} = :{c}" for c in subset) +
+        ", updated_at = :now, updated_by = :uby WHERE user_id = :uid AND is_deleted = 0")
+    for k in range(1, len(_ADMIN_PROFILE_FIELDS) + 1)
+    for subset in combinations(sorted(_ADMIN_PROFILE_FIELDS), k)
+}
+
+# Cross-request memo for user profiles; per-request reuse goes through
+# flask.g so repeated calls within one request never re-run the join
+_PROFILE_CACHE: Dict[str, tuple] = {}
+_PROFILE_TTL = 60  # seconds
+
+# Roles are seeded by the schema and never written at runtime, so the table
+# is loaded once per process. Clear both dicts if that ever changes.
+_ROLE_CACHE: Dict[str, tuple] = {}
+_ROLES_BY_ID: Dict[Any, tuple] = {}
+_ROLE_CACHE_LOCK = threading.Lock()
+
+# College names change rarely; refreshed on a short TTL for listing enrichment
+_COLLEGE_CACHE: Dict[str, str] = {}
+_COLLEGE_CACHE_TS = 0.0
+_COLLEGE_TTL = 60  # seconds
+
+
+def _as_uuid(value) -> uuid.UUID:
+    """Coerce to uuid.UUID without re-parsing values that already are one.
+
+    Route params and g.current_user fields arrive as strings, but values
+    read back from result rows (or passed between service methods) are
+    often UUID instances already - str()-then-parse on those is two
+    allocations and a validation pass for nothing.
+    """
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _load_roles(conn):
+    with _ROLE_CACHE_LOCK:
+        if not _ROLE_CACHE:
+            for rid, code, name, lvl in conn.execute(_ROLES_SQL):
+                _ROLE_CACHE[code] = (rid, lvl)
+                _ROLES_BY_ID[rid] = (code, name)
+
+
+def _role_lookup(conn, role_code: str) -> Optional[tuple]:
+    """role_code -> (role_id, hierarchy_level), lazily loaded on first miss"""
+    if not _ROLE_CACHE: _load_roles(conn)
+    return _ROLE_CACHE.get(role_code)
+
+
+def _role_by_id(conn, role_id) -> tuple:
+    """role_id -> (role_code, role_name) from the same catalog"""
+    if not _ROLES_BY_ID: _load_roles(conn)
+    return _ROLES_BY_ID.get(role_id, (None, None))
+
+
+def _college_names(conn) -> Dict[str, str]:
+    """str(college_id) -> college_name, refreshed on TTL expiry"""
+    global _COLLEGE_CACHE_TS
+    if not _COLLEGE_CACHE or time.monotonic() - _COLLEGE_CACHE_TS > _COLLEGE_TTL:
+        names = {str(cid): name for cid, name in conn.execute(_COLLEGES_SQL)}
+        _COLLEGE_CACHE.clear()
+        _COLLEGE_CACHE.update(names)
+        _COLLEGE_CACHE_TS = time.monotonic()
+    return _COLLEGE_CACHE
+
+
+def _utcnow() -> datetime:
+    """One timestamp per request, so bulk mutations share a single value
+    instead of allocating and formatting a datetime per write"""
+    if has_request_context():
+        ts = getattr(g, '_utcnow', None)
+        if ts is None:
+            ts = datetime.utcnow()
+            g._utcnow = ts
+        return ts
+    return datetime.utcnow()
+
+
+def _encode_cursor(created_at, user_id) -> str:
+    """Opaque keyset cursor: base64 of the last row's (created_at, user_id)"""
+    payload = json.dumps({"created_at": str(created_at), "user_id": str(user_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+# Shared fallback for unauthenticated callers - read-only by convention, so
+# _get_user_context never allocates in the anonymous case
+_ANON_CONTEXT = {'role': None, 'user_id': None, 'college_id': None}
+
+# Role groups for the access checks at every entry point; frozensets give
+# O(1) membership instead of a tuple scan per call
+_SELF_ONLY_ROLES = frozenset(('FACULTY', 'STAFF', 'STUDENT'))
+_ADMIN_ROLES = frozenset(('SUPER_ADMIN', 'COLLEGE_ADMIN'))
+_LIST_ROLES = _ADMIN_ROLES | frozenset(('FACULTY', 'STUDENT'))
+_TENANT_BOUND_ROLES = frozenset(('COLLEGE_ADMIN', 'FACULTY', 'STUDENT'))
 
 
 class UserService:
     """Service for user management with RBAC enforcement"""
-    
+
     def __init__(self, db_path: str = None):
         pass # DB path not needed for SQLAlchemy
-    
+
     def _get_user_context(self) -> Dict:
         """Get current user context from Flask g"""
-        user = getattr(g, 'current_user', None)
-        if not user:
-            return {'role': None, 'user_id': None, 'college_id': None}
-        return user
+        return getattr(g, 'current_user', None) or _ANON_CONTEXT
+
+    @staticmethod
+    def clear_role_cache() -> None:
+        """Drop the process-wide role catalog (for admin tooling after any
+        change to the roles table); it reloads lazily on the next lookup."""
+        with _ROLE_CACHE_LOCK:
+            _ROLE_CACHE.clear()
+            _ROLES_BY_ID.clear()
     
     # =========================================================================
     # USER PROFILE OPERATIONS
     # =========================================================================
     
     def get_user_profile(self, user_id: str) -> Dict:
-        """Get user profile with role information"""
+        """Get user profile with role information.
+
+        Memoized on flask.g for the request and in a short module-level TTL
+        cache across requests; tenant checks still run on every call.
+        """
         current_user = self._get_user_context()
-        if current_user['role'] in ('FACULTY', 'STAFF', 'STUDENT'):
+        if current_user['role'] in _SELF_ONLY_ROLES:
             if current_user['user_id'] != user_id:
                 return {'error': 'ACCESS_DENIED', 'message': 'You can only view your own profile'}
-        
-        db = current_app.extensions['sqlalchemy']
-        with db.engine.connect() as conn:
-            uid_uuid = uuid.UUID(str(user_id))
-            query = text("""
-                SELECT u.user_id, u.email, u.full_name, u.first_name, u.last_name,
-                       u.avatar_url, u.phone, u.status, u.email_verified,
-                       u.last_login_at, u.college_id,
-                       r.role_code, r.role_name,
-                       c.college_name, c.college_logo_url
-                FROM users u
-                JOIN roles r ON u.role_id = r.role_id
-                LEFT JOIN colleges c ON u.college_id = c.college_id
-                WHERE u.user_id = :uid AND u.is_deleted = 0
-            """)
-            result = conn.execute(query, {"uid": uid_uuid}).fetchone()
+
+        key = str(user_id)
+        profile = getattr(g, '_profile_cache', {}).get(key)
+        if profile is None:
+            cached = _PROFILE_CACHE.get(key)
+            if cached and time.monotonic() - cached[1] < _PROFILE_TTL:
+                profile = cached[0]
+        if profile is None:
+            db = current_app.extensions['sqlalchemy']
+            with db.engine.connect() as conn:
+                uid_uuid = _as_uuid(user_id)
+                result = conn.execute(_PROFILE_SQL, {"uid": uid_uuid}).fetchone()
             if not result: return {'error': 'NOT_FOUND', 'message': 'User not found'}
             row = result._mapping
-            
-            if current_user['role'] == 'COLLEGE_ADMIN':
-                if str(row['college_id']) != current_user['college_id']:
-                    return {'error': 'ACCESS_DENIED', 'message': 'User not in your college'}
-            
-            return {
+
+            profile = {
                 'user_id': str(row['user_id']),
                 'email': row['email'],
                 'full_name': row['full_name'],
@@ -74,143 +288,249 @@ class UserService:
                     'logo_url': row['college_logo_url']
                 } if row['college_id'] else None
             }
+            if len(_PROFILE_CACHE) > 4096: _PROFILE_CACHE.clear()
+            _PROFILE_CACHE[key] = (profile, time.monotonic())
+        g.setdefault('_profile_cache', {})[key] = profile
+
+        if current_user['role'] == 'COLLEGE_ADMIN':
+            profile_cid = profile['college']['id'] if profile['college'] else None
+            if profile_cid != current_user['college_id']:
+                # Same shape as a genuine miss, so probing foreign UUIDs
+                # cannot distinguish "exists elsewhere" from "does not exist"
+                return {'error': 'NOT_FOUND', 'message': 'User not found'}
+
+        return profile
+
+    @staticmethod
+    def _invalidate_profile(user_id: str):
+        """Drop a user's cached profile after a mutating write"""
+        key = str(user_id)
+        _PROFILE_CACHE.pop(key, None)
+        try: getattr(g, '_profile_cache', {}).pop(key, None)
+        except RuntimeError: pass
     
     def update_profile(self, user_id: str, data: Dict) -> Dict:
         """Update user profile"""
         current_user = self._get_user_context()
-        if current_user['role'] in ('FACULTY', 'STAFF', 'STUDENT') and current_user['user_id'] != user_id:
+        if current_user['role'] in _SELF_ONLY_ROLES and current_user['user_id'] != user_id:
             return {'error': 'ACCESS_DENIED'}
         
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
-            allowed = ['full_name', 'first_name', 'last_name', 'phone']
-            if current_user['role'] in ('SUPER_ADMIN', 'COLLEGE_ADMIN'): allowed.append('status')
-            
-            update_data = {k: v for k, v in data.items() if k in allowed}
+            allowed = _ADMIN_PROFILE_FIELDS if current_user['role'] in _ADMIN_ROLES else _PROFILE_FIELDS
+            # Set intersection runs in C instead of a per-key membership loop
+            update_data = {k: data[k] for k in data.keys() & allowed}
             if not update_data: return {'error': 'VALIDATION'}
             
-            set_clause = ', '.join([f"{k} = :{k}" for k in update_data.keys()])
-            uid_uuid = uuid.UUID(str(user_id))
-            params = {**update_data, "now": datetime.utcnow(), "uby": uuid.UUID(str(current_user['user_id'])), "uid": uid_uuid}
-            
-            result = conn.execute(text(f"UPDATE users SET {set_clause}, updated_at = :now, updated_by = :uby WHERE user_id = :uid AND is_deleted = 0"), params)
+            uid_uuid = _as_uuid(user_id)
+            params = {**update_data, "now": _utcnow(), "uby": _as_uuid(current_user['user_id']), "uid": uid_uuid}
+
+            result = conn.execute(_UPDATE_STMTS[frozenset(update_data)], params)
             conn.commit()
             
             if result.rowcount == 0: return {'error': 'NOT_FOUND'}
-            self._log_audit(action='UPDATE', entity_type='user', entity_id=user_id, new_value=json.dumps(update_data), summary='Profile updated')
+            self._invalidate_profile(user_id)
+            self._log_audit(action='UPDATE', entity_type='user', entity_id=user_id, new_value=update_data, summary='Profile updated', conn=conn)
             return {'success': True}
     
     def get_stats(self, college_id: str = None) -> Dict:
         """Get aggregate user stats"""
         current_user = self._get_user_context()
-        if current_user['role'] not in ('SUPER_ADMIN', 'COLLEGE_ADMIN'): return {}
+        if current_user['role'] not in _ADMIN_ROLES: return {}
             
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
             if not college_id and current_user['role'] == 'SUPER_ADMIN':
-                res = conn.execute(text("SELECT COUNT(*) FROM users WHERE is_deleted = 0")).fetchone()
-                return {'total_users': res[0]}
-            
-            target_cid = uuid.UUID(str(college_id or current_user['college_id']))
-            stats = {}
-            for role in ('FACULTY', 'STAFF', 'STUDENT'):
-                res = conn.execute(text("""
-                    SELECT COUNT(*) FROM users u JOIN roles r ON u.role_id = r.role_id
-                    WHERE u.college_id = :cid AND r.role_code = :rcode AND u.is_deleted = 0
-                """), {"cid": target_cid, "rcode": role}).fetchone()
-                stats[f'total_{role.lower()}'] = res[0]
+                target_cid = None
+            else:
+                target_cid = _as_uuid(college_id or current_user['college_id'])
+            # One round trip for the overall total and the per-role breakdown
+            stats = {'total_users': 0}
+            stats.update({f'total_{role.lower()}': 0 for role in ('FACULTY', 'STAFF', 'STUDENT')})
+            res = conn.execute(_STATS_SQL, {"cid": target_cid})
+            for role_code, cnt in res:
+                stats['total_users' if role_code is None else f'total_{role_code.lower()}'] = cnt
+            return stats
+
+    def get_stats_bulk(self, college_ids: List[str]) -> Dict:
+        """Per-college role breakdowns in one grouped query (Super Admin only).
+
+        Replaces the N-calls-to-get_stats pattern for dashboard overviews:
+        one statement groups by (college_id, role_code) across all requested
+        colleges; colleges with no matching users come back zero-filled.
+        """
+        current_user = self._get_user_context()
+        if current_user['role'] != 'SUPER_ADMIN': return {'error': 'ACCESS_DENIED'}
+        try:
+            cids = [_as_uuid(c) for c in college_ids]
+        except (ValueError, TypeError):
+            return {'error': 'VALIDATION', 'message': 'Invalid college id'}
+        if not cids: return {'error': 'VALIDATION', 'message': 'college_ids is required'}
+
+        db = current_app.extensions['sqlalchemy']
+        with db.engine.connect() as conn:
+            stats = {str(cid): {f'total_{role.lower()}': 0 for role in ('FACULTY', 'STAFF', 'STUDENT')}
+                     for cid in cids}
+            for cid, role_code, cnt in conn.execute(_STATS_BULK_SQL, {"cids": cids}):
+                stats[str(cid)][f'total_{role_code.lower()}'] = cnt
             return stats
 
     def get_users(self, role_filter: str = None, status_filter: str = None,
-                  college_id_filter: str = None, page: int = 1, per_page: int = 20) -> Dict:
-        """Get users list (Admin only)"""
+                  college_id_filter: str = None, page: int = 1, per_page: int = 20,
+                  after_cursor: str = None, include_total: bool = True,
+                  fields: List[str] = None) -> Dict:
+        """Get users list (Admin only).
+
+        Passing `after_cursor` (the `next_cursor` from a previous page) uses
+        keyset pagination; the legacy `page` path stays for jump-to-page UIs.
+        With `include_total=False` the COUNT(*) is skipped and `has_next`
+        (from fetching one extra row) replaces total/pages. `fields` trims
+        the projection to the listed columns (cursor pages always carry
+        user_id, which the cursor itself needs).
+        """
         current_user = self._get_user_context()
-        if current_user['role'] not in ('SUPER_ADMIN', 'COLLEGE_ADMIN', 'FACULTY', 'STUDENT'):
+        if current_user['role'] not in _LIST_ROLES:
             return {'error': 'ACCESS_DENIED'}
-        
+
+        page, per_page, page_err = clamp_pagination(page, per_page)
+        if page_err: return page_err
+
+        requested = frozenset(fields) if fields else _LIST_FIELDS
+        if not requested <= _LIST_FIELDS:
+            return {'error': 'VALIDATION', 'message': 'Unknown fields: ' + ', '.join(sorted(requested - _LIST_FIELDS))}
+        if after_cursor: requested |= {'user_id'}
+        select_cols, row_keys, need_role, need_college = _list_shape(requested)
+
         fixed_cid = None
-        if current_user['role'] in ('COLLEGE_ADMIN', 'FACULTY', 'STUDENT'): fixed_cid = uuid.UUID(str(current_user['college_id']))
-        elif current_user['role'] == 'SUPER_ADMIN' and college_id_filter: fixed_cid = uuid.UUID(str(college_id_filter))
+        if current_user['role'] in _TENANT_BOUND_ROLES: fixed_cid = _as_uuid(current_user['college_id'])
+        elif current_user['role'] == 'SUPER_ADMIN' and college_id_filter: fixed_cid = _as_uuid(college_id_filter)
         
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
-            base_query = "FROM users u JOIN roles r ON u.role_id = r.role_id LEFT JOIN colleges c ON u.college_id = c.college_id WHERE u.is_deleted = 0"
+            # Roles and colleges are resolved from the in-process catalogs, so
+            # the listing reads a single table instead of a three-way join
+            base_query = "FROM users u WHERE u.is_deleted = 0"
             params = {}
             if fixed_cid:
                 base_query += " AND u.college_id = :cid"
                 params['cid'] = fixed_cid
             if role_filter:
-                base_query += " AND r.role_code = :rcode"
-                params['rcode'] = role_filter
+                role_row = _role_lookup(conn, role_filter)
+                if not role_row:
+                    base_query += " AND 1 = 0"
+                else:
+                    base_query += " AND u.role_id = :rid"
+                    params['rid'] = role_row[0]
             if status_filter:
                 base_query += " AND u.status = :status"
                 params['status'] = status_filter
-            
-            total = conn.execute(text(f"SELECT COUNT(*) {base_query}"), params).fetchone()[0]
+
+            if after_cursor:
+                # Keyset pagination: seek past the cursor row instead of
+                # scanning and discarding OFFSET rows on deep pages
+                try:
+                    cur = json.loads(base64.urlsafe_b64decode(after_cursor.encode()).decode())
+                    cur_uid = _as_uuid(cur['user_id'])
+                except Exception:
+                    return {'error': 'VALIDATION', 'message': 'Invalid cursor'}
+                base_query += " AND (u.created_at < :cur_ts OR (u.created_at = :cur_ts AND u.user_id < :cur_uid))"
+                params.update({"cur_ts": cur['created_at'], "cur_uid": cur_uid, "limit": per_page})
+                res = conn.execute(text(f"SELECT {select_cols}, u.created_at {base_query} ORDER BY u.created_at DESC, u.user_id DESC LIMIT :limit"), params)
+                items = [dict(zip(row_keys + ('created_at',), row)) for row in res]
+                next_cursor = _encode_cursor(items[-1]['created_at'], items[-1]['user_id']) if len(items) == per_page else None
+                for item in items: item.pop('created_at', None)
+                return {'items': self._enrich_user_rows(conn, items, need_role, need_college), 'per_page': per_page, 'next_cursor': next_cursor}
+
+            if not include_total:
+                # Countless page: one extra row tells us has_next, so the
+                # COUNT(*) is skipped entirely
+                params.update({"limit": per_page + 1, "offset": (page - 1) * per_page})
+                res = conn.execute(text(f"SELECT {select_cols} {base_query} ORDER BY u.created_at DESC, u.user_id DESC LIMIT :limit OFFSET :offset"), params)
+                items = [dict(zip(row_keys, row)) for row in res]
+                return {'items': self._enrich_user_rows(conn, items[:per_page], need_role, need_college), 'page': page, 'per_page': per_page, 'has_next': len(items) > per_page}
+
+            # COUNT(*) OVER () folds the total into the page fetch, so the
+            # filters are evaluated once instead of twice per page load
             params.update({"limit": per_page, "offset": (page - 1) * per_page})
-            res = conn.execute(text(f"SELECT u.user_id, u.email, u.full_name, u.status, u.last_login_at, r.role_code, r.role_name, c.college_name {base_query} ORDER BY u.created_at DESC LIMIT :limit OFFSET :offset"), params)
-            
+            res = conn.execute(text(f"SELECT {select_cols}, COUNT(*) OVER () AS _total {base_query} ORDER BY u.created_at DESC, u.user_id DESC LIMIT :limit OFFSET :offset"), params)
+            rows = res.fetchall()
+            if rows:
+                total = rows[0][-1]
+            else:
+                # Past the last page the window sees no rows; only then fall
+                # back to a bare COUNT so the page arithmetic stays correct
+                total = conn.execute(text(f"SELECT COUNT(*) {base_query}"), params).fetchone()[0] if page > 1 else 0
+            items = [dict(zip(row_keys, row[:-1])) for row in rows]
+
             return {
-                'items': [dict(row._mapping) for row in res], 'total': total,
+                'items': self._enrich_user_rows(conn, items, need_role, need_college), 'total': total,
                 'page': page, 'per_page': per_page, 'pages': (total + per_page - 1) // per_page if per_page > 0 else 1
             }
+
+    @staticmethod
+    def _enrich_user_rows(conn, items: List[Dict], need_role: bool = True,
+                          need_college: bool = True) -> List[Dict]:
+        """Merge role_code/role_name/college_name from the in-process catalogs"""
+        colleges = _college_names(conn) if (items and need_college) else {}
+        for item in items:
+            if need_role:
+                code, name = _role_by_id(conn, item.pop('role_id'))
+                item['role_code'] = code
+                item['role_name'] = name
+            if need_college:
+                cid = item.pop('college_id')
+                item['college_name'] = colleges.get(str(cid)) if cid else None
+        return items
     
     def create_user(self, data: Dict) -> Dict:
         """Create new user"""
         current_user = self._get_user_context()
-        if current_user['role'] not in ('SUPER_ADMIN', 'COLLEGE_ADMIN'): return {'error': 'ACCESS_DENIED'}
+        if current_user['role'] not in _ADMIN_ROLES: return {'error': 'ACCESS_DENIED'}
         
         email = data.get('email', '').lower().strip()
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
-            transaction = conn.begin()
+            role_row = _role_lookup(conn, data['role_code'])
+            if not role_row: return {'error': 'VALIDATION', 'message': 'Invalid role'}
+            role_id, hierarchy_level = role_row
+
+            if current_user['role'] == 'COLLEGE_ADMIN':
+                if hierarchy_level >= _role_lookup(conn, 'COLLEGE_ADMIN')[1]:
+                    return {'error': 'ACCESS_DENIED'}
+
+            college_id = _as_uuid(data.get('college_id')) if data.get('college_id') else (_as_uuid(current_user['college_id']) if current_user['college_id'] else None)
+            now = _utcnow()
+            new_uid = uuid.uuid4()
             try:
-                existing = conn.execute(text("SELECT user_id, status, is_deleted FROM users WHERE LOWER(email) = :email"), {"email": email}).fetchone()
-                if existing:
-                    m = existing._mapping
-                    if not (m['is_deleted'] == 1 or m['status'] == 'INACTIVE'):
-                        transaction.rollback()
-                        return {'error': 'DUPLICATE', 'message': 'Email already registered'}
-                
-                role_row = conn.execute(text("SELECT role_id, hierarchy_level FROM roles WHERE role_code = :code"), {"code": data['role_code']}).fetchone()
-                if not role_row: return {'error': 'VALIDATION', 'message': 'Invalid role'}
-                role_m = role_row._mapping
-                
-                if current_user['role'] == 'COLLEGE_ADMIN':
-                    adm_row = conn.execute(text("SELECT hierarchy_level FROM roles WHERE role_code = 'COLLEGE_ADMIN'")).fetchone()
-                    if role_m['hierarchy_level'] >= adm_row[0]:
-                        transaction.rollback()
-                        return {'error': 'ACCESS_DENIED'}
-                
-                college_id = uuid.UUID(str(data.get('college_id'))) if data.get('college_id') else (uuid.UUID(str(current_user['college_id'])) if current_user['college_id'] else None)
-                now = datetime.utcnow()
-                uby = uuid.UUID(str(current_user['user_id']))
-                
-                if existing:
-                    uid = existing._mapping['user_id']
-                    conn.execute(text("UPDATE users SET full_name = :name, role_id = :rid, college_id = :cid, status = 'ACTIVE', is_deleted = 0, updated_by = :uby, updated_at = :now WHERE user_id = :uid"),
-                                 {"name": data.get('full_name', ''), "rid": role_m['role_id'], "cid": college_id, "uby": uby, "now": now, "uid": uid})
-                else:
-                    uid = uuid.uuid4()
-                    conn.execute(text("INSERT INTO users (user_id, email, full_name, role_id, college_id, status, created_by, created_at, updated_at) VALUES (:uid, :email, :name, :rid, :cid, 'ACTIVE', :uby, :now, :now)"),
-                                 {"uid": uid, "email": email, "name": data.get('full_name', ''), "rid": role_m['role_id'], "cid": college_id, "uby": uby, "now": now})
-                
-                transaction.commit()
-                self._log_audit(action='CREATE' if not existing else 'REACTIVATE', entity_type='user', entity_id=str(uid), summary=f"User management: {email}")
-                return {'success': True, 'user_id': str(uid)}
+                row = conn.execute(_UPSERT_USER_SQL,
+                                   {"uid": new_uid, "email": email, "name": data.get('full_name', ''), "rid": role_id,
+                                    "cid": college_id, "uby": _as_uuid(current_user['user_id']), "now": now}).fetchone()
+                conn.commit()
+            except IntegrityError:
+                # Case-variant duplicate caught by idx_users_lower_email
+                conn.rollback()
+                return {'error': 'DUPLICATE', 'message': 'Email already registered'}
             except Exception as e:
-                transaction.rollback()
+                conn.rollback()
                 return {'error': 'DATABASE', 'message': str(e)}
 
+            if row is None:
+                # Conflict with an active row: DO UPDATE's WHERE refused it
+                return {'error': 'DUPLICATE', 'message': 'Email already registered'}
+            uid = row[0]
+            reactivated = str(uid) != str(new_uid)
+            if reactivated: self._invalidate_profile(uid)
+            self._log_audit(action='REACTIVATE' if reactivated else 'CREATE', entity_type='user', entity_id=str(uid), summary=f"User management: {email}", conn=conn)
+            return {'success': True, 'user_id': str(uid)}
+
     def update_user_role(self, user_id: str, new_role: str, new_college_id: str = None) -> Dict:
-        from ..middleware.rbac_middleware import validate_role_change
         current_user = self._get_user_context()
-        if current_user['role'] not in ('SUPER_ADMIN', 'COLLEGE_ADMIN'): return {'error': 'ACCESS_DENIED'}
+        if current_user['role'] not in _ADMIN_ROLES: return {'error': 'ACCESS_DENIED'}
         
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
-            uid_uuid = uuid.UUID(str(user_id))
-            target = conn.execute(text("SELECT u.college_id, r.role_code FROM users u JOIN roles r ON u.role_id = r.role_id WHERE u.user_id = :uid AND u.is_deleted = 0"), {"uid": uid_uuid}).fetchone()
+            uid_uuid = _as_uuid(user_id)
+            target = conn.execute(_TARGET_ROLE_SQL, {"uid": uid_uuid}).fetchone()
             if not target: return {'error': 'NOT_FOUND'}
             tm = target._mapping
             
@@ -218,32 +538,127 @@ class UserService:
             try: validate_role_change(current_user['role'], tm['role_code'], new_role)
             except Exception as e: return {'error': 'ROLE_ESCALATION', 'message': str(e)}
             
-            nr = conn.execute(text("SELECT role_id FROM roles WHERE role_code = :rcode"), {"rcode": new_role}).fetchone()
-            cid = uuid.UUID(new_college_id) if new_college_id else tm['college_id']
-            
-            conn.execute(text("UPDATE users SET role_id = :rid, college_id = :cid, updated_by = :uby, updated_at = :now WHERE user_id = :uid"),
-                         {"rid": nr[0], "cid": cid, "uby": uuid.UUID(str(current_user['user_id'])), "now": datetime.utcnow(), "uid": uid_uuid})
+            nr = _role_lookup(conn, new_role)
+            if not nr: return {'error': 'VALIDATION', 'message': 'Invalid role'}
+            cid = _as_uuid(new_college_id) if new_college_id else tm['college_id']
+
+            # College and current-role guards live in the WHERE clause so
+            # neither check can race with the UPDATE after the SELECT above
+            result = conn.execute(_UPDATE_ROLE_SQL,
+                {"rid": nr[0], "cid": cid, "uby": _as_uuid(current_user['user_id']), "now": _utcnow(),
+                 "uid": uid_uuid, "role": current_user['role'],
+                 "cur_rid": _role_lookup(conn, tm['role_code'])[0],
+                 "acid": _as_uuid(current_user['college_id']) if current_user['role'] == 'COLLEGE_ADMIN' else None})
             conn.commit()
+            if result.rowcount == 0: return {'error': 'NOT_FOUND'}
+            self._invalidate_profile(user_id)
             return {'success': True}
 
     def deactivate_user(self, user_id: str) -> Dict:
         current_user = self._get_user_context()
-        if current_user['role'] not in ('SUPER_ADMIN', 'COLLEGE_ADMIN'): return {'error': 'ACCESS_DENIED'}
+        if current_user['role'] not in _ADMIN_ROLES: return {'error': 'ACCESS_DENIED'}
         db = current_app.extensions['sqlalchemy']
         with db.engine.connect() as conn:
-            uid_uuid = uuid.UUID(str(user_id))
-            conn.execute(text("UPDATE users SET status = 'INACTIVE', updated_by = :uby, updated_at = :now WHERE user_id = :uid AND is_deleted = 0"),
-                         {"uby": uuid.UUID(str(current_user['user_id'])), "now": datetime.utcnow(), "uid": uid_uuid})
+            uid_uuid = _as_uuid(user_id)
+            # Tenant guard lives in the WHERE clause: rowcount == 0 covers
+            # both "not found" and "wrong college" without a prior SELECT
+            admin_cid = _as_uuid(current_user['college_id']) if current_user['role'] == 'COLLEGE_ADMIN' else None
+            result = conn.execute(_DEACTIVATE_SQL,
+                {"uby": _as_uuid(current_user['user_id']), "now": _utcnow(), "uid": uid_uuid,
+                 "role": current_user['role'], "acid": admin_cid})
             conn.commit()
+            if result.rowcount == 0: return {'error': 'NOT_FOUND'}
+            self._invalidate_profile(user_id)
             return {'success': True}
 
+    def deactivate_users(self, user_ids: List[str]) -> Dict:
+        """Deactivate many users in one statement and one commit.
+
+        Same tenant guard as deactivate_user, applied set-wide: rows outside
+        a COLLEGE_ADMIN's college simply don't match, so `updated` can be
+        lower than the number of ids submitted.
+        """
+        current_user = self._get_user_context()
+        if current_user['role'] not in _ADMIN_ROLES: return {'error': 'ACCESS_DENIED'}
+        try:
+            uids = [_as_uuid(u) for u in user_ids]
+        except (ValueError, TypeError):
+            return {'error': 'VALIDATION', 'message': 'Invalid user id'}
+        if not uids: return {'error': 'VALIDATION', 'message': 'user_ids is required'}
+
+        db = current_app.extensions['sqlalchemy']
+        with db.engine.connect() as conn:
+            admin_cid = _as_uuid(current_user['college_id']) if current_user['role'] == 'COLLEGE_ADMIN' else None
+            result = conn.execute(_DEACTIVATE_MANY_SQL,
+                {"uids": uids, "uby": _as_uuid(current_user['user_id']), "now": _utcnow(),
+                 "role": current_user['role'], "acid": admin_cid})
+            conn.commit()
+            for uid in uids: self._invalidate_profile(uid)
+            self._log_audit(action='DEACTIVATE_BULK', entity_type='user', entity_id=None,
+                            summary=f"Bulk deactivate: {result.rowcount} of {len(uids)} users", conn=conn)
+            return {'success': True, 'updated': result.rowcount, 'requested': len(uids)}
+
+    def update_user_roles(self, changes: List[Dict]) -> Dict:
+        """Apply many role changes with one target read and one batched UPDATE.
+
+        `changes` is a list of {'user_id', 'role_code', 'college_id'?} dicts.
+        Targets are read in one IN query, each change is validated in Python
+        (tenant + hierarchy, as in update_user_role), and the valid ones go
+        through a single executemany sharing one commit. Per-id failures come
+        back in `errors` instead of aborting the batch.
+        """
+        current_user = self._get_user_context()
+        if current_user['role'] not in _ADMIN_ROLES: return {'error': 'ACCESS_DENIED'}
+        if not changes: return {'error': 'VALIDATION', 'message': 'changes is required'}
+
+        db = current_app.extensions['sqlalchemy']
+        with db.engine.connect() as conn:
+            try:
+                wanted = {str(_as_uuid(c['user_id'])): c for c in changes}
+            except (KeyError, ValueError, TypeError):
+                return {'error': 'VALIDATION', 'message': 'Invalid user id'}
+            targets = {str(row[0]): row for row in
+                       conn.execute(_TARGET_ROLES_MANY_SQL, {"uids": [_as_uuid(u) for u in wanted]})}
+
+            batch, errors = [], []
+            admin_cid = _as_uuid(current_user['college_id']) if current_user['role'] == 'COLLEGE_ADMIN' else None
+            for uid_key, change in wanted.items():
+                target = targets.get(uid_key)
+                if target is None:
+                    errors.append({'user_id': uid_key, 'error': 'NOT_FOUND'}); continue
+                _, target_cid, old_role = target
+                if current_user['role'] == 'COLLEGE_ADMIN' and str(target_cid) != current_user['college_id']:
+                    errors.append({'user_id': uid_key, 'error': 'NOT_FOUND'}); continue
+                try: validate_role_change(current_user['role'], old_role, change.get('role_code'))
+                except Exception as e:
+                    errors.append({'user_id': uid_key, 'error': 'ROLE_ESCALATION', 'message': str(e)}); continue
+                nr = _role_lookup(conn, change.get('role_code'))
+                if not nr:
+                    errors.append({'user_id': uid_key, 'error': 'VALIDATION', 'message': 'Invalid role'}); continue
+                batch.append({"rid": nr[0], "cid": _as_uuid(change['college_id']) if change.get('college_id') else target_cid,
+                              "uby": _as_uuid(current_user['user_id']), "now": _utcnow(), "uid": _as_uuid(uid_key),
+                              "role": current_user['role'], "cur_rid": _role_lookup(conn, old_role)[0], "acid": admin_cid})
+            if batch:
+                conn.execute(_UPDATE_ROLE_SQL, batch)
+                conn.commit()
+                for params in batch: self._invalidate_profile(params['uid'])
+                self._log_audit(action='ROLE_CHANGE_BULK', entity_type='user', entity_id=None,
+                                summary=f"Bulk role change: {len(batch)} users", conn=conn)
+            return {'success': True, 'updated': len(batch), 'errors': errors}
+
     def _log_audit(self, action: str, entity_type: str, entity_id: str,
-                   old_value: str = None, new_value: str = None, summary: str = None):
+                   old_value: str = None, new_value: str = None, summary: str = None,
+                   conn=None):
         try:
-            from .audit_service import AuditService
             db = current_app.extensions.get('sqlalchemy')
             if not db: return
-            audit = AuditService()
-            audit.log(action_type=action, entity_type=entity_type, entity_id=entity_id,
-                      old_value=old_value, new_value=new_value, change_summary=summary)
+            audit = _AUDIT
+            if has_request_context():
+                # Queued on g; flushed in one batch by the after_request hook
+                audit.enqueue(action_type=action, entity_type=entity_type, entity_id=entity_id,
+                              old_value=old_value, new_value=new_value, change_summary=summary)
+            else:
+                audit.log(action_type=action, entity_type=entity_type, entity_id=entity_id,
+                          old_value=old_value, new_value=new_value, change_summary=summary,
+                          conn=conn)
         except Exception as e: current_app.logger.error(f"User audit log failed: {e}")
@@ -5,104 +5,164 @@ Structured error handling for the application
 
 
 class CampusIQException(Exception):
-    """Base exception for CampusIQ"""
-    def __init__(self, message, code='ERROR', status_code=500, details=None):
+    """Base exception for CampusIQ.
+
+    `code` and `status_code` are class attributes overridden per subclass,
+    so raising one stores only the dynamic message (and details, when any)
+    on the instance - hot error paths such as auth failures and rate-limit
+    bursts allocate no per-instance constants.
+    """
+    __slots__ = ()
+    code = 'ERROR'
+    status_code = 500
+    details = {}
+
+    def __init__(self, message, code=None, status_code=None, details=None):
         self.message = message
-        self.code = code
-        self.status_code = status_code
-        self.details = details or {}
-        super().__init__(self.message)
+        if code is not None:
+            self.code = code
+        if status_code is not None:
+            self.status_code = status_code
+        if details is not None:
+            self.details = details
+        super().__init__(message)
 
 
 class UnauthorizedException(CampusIQException):
     """Authentication required or failed"""
+    __slots__ = ()
+    code = 'UNAUTHORIZED'
+    status_code = 401
+
     def __init__(self, message='Authentication required'):
-        super().__init__(message, code='UNAUTHORIZED', status_code=401)
+        super().__init__(message)
 
 
 class ForbiddenException(CampusIQException):
     """Access denied due to insufficient permissions"""
+    __slots__ = ()
+    code = 'FORBIDDEN'
+    status_code = 403
+
     def __init__(self, message='Access denied'):
-        super().__init__(message, code='FORBIDDEN', status_code=403)
+        super().__init__(message)
 
 
 class NotFoundException(CampusIQException):
     """Resource not found"""
+    __slots__ = ()
+    code = 'NOT_FOUND'
+    status_code = 404
+
     def __init__(self, message='Resource not found', resource_type=None, resource_id=None):
         details = {}
         if resource_type:
             details['resource_type'] = resource_type
         if resource_id:
             details['resource_id'] = str(resource_id)
-        super().__init__(message, code='NOT_FOUND', status_code=404, details=details)
+        super().__init__(message, details=details or None)
 
 
 class ValidationException(CampusIQException):
     """Input validation failed"""
+    __slots__ = ()
+    code = 'VALIDATION_ERROR'
+    status_code = 400
+
     def __init__(self, message='Validation failed', fields=None):
         self.fields = fields or {}
-        super().__init__(message, code='VALIDATION_ERROR', status_code=400, details={'fields': self.fields})
+        super().__init__(message, details={'fields': self.fields})
 
 
 class TenantAccessException(CampusIQException):
     """Cross-tenant access attempt blocked"""
+    __slots__ = ()
+    code = 'TENANT_ACCESS_DENIED'
+    status_code = 403
+
     def __init__(self, message='Access to this college data is not permitted'):
-        super().__init__(message, code='TENANT_ACCESS_DENIED', status_code=403)
+        super().__init__(message)
 
 
 class RoleEscalationException(CampusIQException):
     """Attempted role escalation detected"""
+    __slots__ = ()
+    code = 'ROLE_ESCALATION'
+    status_code = 403
+
     def __init__(self, message='Role escalation attempt detected'):
-        super().__init__(message, code='ROLE_ESCALATION', status_code=403)
+        super().__init__(message)
 
 
 class CollegeNotApprovedException(CampusIQException):
     """College not approved for access"""
+    __slots__ = ()
+    code = 'COLLEGE_NOT_APPROVED'
+    status_code = 403
+
     def __init__(self, college_name=None):
         message = 'Your college is not approved for access'
         if college_name:
             message = f'{college_name} is not approved for access yet'
-        super().__init__(message, code='COLLEGE_NOT_APPROVED', status_code=403)
+        super().__init__(message)
 
 
 class TokenExpiredException(CampusIQException):
     """JWT token has expired"""
+    __slots__ = ()
+    code = 'TOKEN_EXPIRED'
+    status_code = 401
+
     def __init__(self, message='Token has expired'):
-        super().__init__(message, code='TOKEN_EXPIRED', status_code=401)
+        super().__init__(message)
 
 
 class InvalidTokenException(CampusIQException):
     """JWT token is invalid"""
+    __slots__ = ()
+    code = 'INVALID_TOKEN'
+    status_code = 401
+
     def __init__(self, message='Invalid token'):
-        super().__init__(message, code='INVALID_TOKEN', status_code=401)
+        super().__init__(message)
 
 
 class RateLimitException(CampusIQException):
     """Rate limit exceeded"""
+    __slots__ = ()
+    code = 'RATE_LIMIT_EXCEEDED'
+    status_code = 429
+
     def __init__(self, message='Too many requests, please try again later'):
-        super().__init__(message, code='RATE_LIMIT_EXCEEDED', status_code=429)
+        super().__init__(message)
 
 
 class DatabaseException(CampusIQException):
     """Database operation failed"""
+    __slots__ = ()
+    code = 'DATABASE_ERROR'
+    status_code = 500
+
     def __init__(self, message='Database operation failed', operation=None):
-        details = {}
-        if operation:
-            details['operation'] = operation
-        super().__init__(message, code='DATABASE_ERROR', status_code=500, details=details)
+        super().__init__(message, details={'operation': operation} if operation else None)
 
 
 class QnAException(CampusIQException):
     """QnA query processing failed"""
+    __slots__ = ()
+    code = 'QNA_ERROR'
+    status_code = 400
+
     def __init__(self, message='Unable to process query', query=None):
-        details = {}
-        if query:
-            details['query'] = query[:100]  # Truncate for security
-        super().__init__(message, code='QNA_ERROR', status_code=400, details=details)
+        # Truncate the echoed query for security
+        super().__init__(message, details={'query': query[:100]} if query else None)
 
 
 class ScheduleConflictException(CampusIQException):
     """Schedule conflict detected"""
+    __slots__ = ()
+    code = 'SCHEDULE_CONFLICT'
+    status_code = 409
+
     def __init__(self, message='Schedule conflict detected', conflicts=None):
-        details = {'conflicts': conflicts or []}
-        super().__init__(message, code='SCHEDULE_CONFLICT', status_code=409, details=details)
+        super().__init__(message, details={'conflicts': conflicts or []})
@@ -0,0 +1,27 @@
+"""
+CampusIQ - Pagination bounds
+Server-side clamps shared by the paginated list services
+"""
+
+# Largest page a caller may request; anything above is silently clamped
+PER_PAGE_MAX = 100
+# Deepest OFFSET the legacy page path will run; beyond this the caller is
+# told to switch to cursor pagination instead of triggering a scan that
+# reads and discards page*per_page rows
+OFFSET_MAX = 10_000
+
+
+def clamp_pagination(page, per_page):
+    """Clamp page/per_page to server-side bounds.
+
+    Returns (page, per_page, error) where error is None when the request is
+    within bounds, or the service-style error dict to return as-is.
+    """
+    try:
+        page = max(int(page), 1)
+        per_page = min(max(int(per_page), 1), PER_PAGE_MAX)
+    except (TypeError, ValueError):
+        return 1, 20, {'error': 'VALIDATION', 'message': 'page and per_page must be integers'}
+    if (page - 1) * per_page > OFFSET_MAX:
+        return page, per_page, {'error': 'PAGE_TOO_DEEP', 'message': 'Page too deep - use cursor pagination'}
+    return page, per_page, None
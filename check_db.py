@@ -1,9 +1,23 @@
 
 import os
 import sys
+from functools import lru_cache
 from sqlalchemy import create_engine, text
 from app.config import config
 
+
+@lru_cache(maxsize=8)
+def get_engine(uri):
+    """One small pooled engine per URI, reused across invocations.
+
+    A readiness probe importing check_connection would otherwise build and
+    discard a full engine per probe; with the cache each probe is a pooled
+    SELECT 1, and pre_ping replaces connections dropped since the last one.
+    """
+    return create_engine(uri, pool_size=2, max_overflow=2,
+                         pool_pre_ping=True, pool_recycle=1800)
+
+
 def check_connection():
     env_name = os.environ.get('FLASK_ENV', 'development')
     print(f"Checking database connection for environment: {env_name}")
@@ -38,7 +52,7 @@ def check_connection():
     print(f"Attempting to connect to: {uri}")
 
     try:
-        engine = create_engine(uri)
+        engine = get_engine(uri)
         with engine.connect() as connection:
             result = connection.execute(text("SELECT 1"))
             print("✅ CONNECTION SUCCESSFUL!")
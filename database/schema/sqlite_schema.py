@@ -2,6 +2,7 @@
 CampusIQ - SQLite Schema for Development
 Equivalent schema for local development without Oracle
 """
+import sqlite3
 
 SQLITE_SCHEMA = """
 -- ============================================================================
@@ -312,7 +313,7 @@ CREATE TABLE IF NOT EXISTS qna_logs (
     ip_address TEXT,
     user_agent TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) WITHOUT ROWID;
 
 -- AUDIT LOGS TABLE
 CREATE TABLE IF NOT EXISTS audit_logs (
@@ -335,7 +336,7 @@ CREATE TABLE IF NOT EXISTS audit_logs (
     response_status INTEGER,
     severity TEXT DEFAULT 'INFO',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) WITHOUT ROWID;
 
 -- REFRESH TOKENS TABLE
 CREATE TABLE IF NOT EXISTS refresh_tokens (
@@ -349,7 +350,7 @@ CREATE TABLE IF NOT EXISTS refresh_tokens (
     revoked_at TIMESTAMP,
     revoked_reason TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) WITHOUT ROWID;
 
 -- SYSTEM SETTINGS TABLE
 CREATE TABLE IF NOT EXISTS system_settings (
@@ -365,35 +366,175 @@ CREATE TABLE IF NOT EXISTS system_settings (
     UNIQUE (college_id, setting_key)
 );
 
+-- Full-text shadow of schedules so text filters use MATCH instead of
+-- unindexable '%x%' LIKE scans; triggers keep it in sync with the base table
+CREATE VIRTUAL TABLE IF NOT EXISTS schedules_fts USING fts5(
+    class_code, instructor_name, room_code,
+    content='schedules', content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS schedules_fts_ai AFTER INSERT ON schedules BEGIN
+    INSERT INTO schedules_fts(rowid, class_code, instructor_name, room_code)
+    VALUES (new.rowid, new.class_code, new.instructor_name, new.room_code);
+END;
+
+CREATE TRIGGER IF NOT EXISTS schedules_fts_ad AFTER DELETE ON schedules BEGIN
+    INSERT INTO schedules_fts(schedules_fts, rowid, class_code, instructor_name, room_code)
+    VALUES ('delete', old.rowid, old.class_code, old.instructor_name, old.room_code);
+END;
+
+CREATE TRIGGER IF NOT EXISTS schedules_fts_au AFTER UPDATE ON schedules BEGIN
+    INSERT INTO schedules_fts(schedules_fts, rowid, class_code, instructor_name, room_code)
+    VALUES ('delete', old.rowid, old.class_code, old.instructor_name, old.room_code);
+    INSERT INTO schedules_fts(rowid, class_code, instructor_name, room_code)
+    VALUES (new.rowid, new.class_code, new.instructor_name, new.room_code);
+END;
+
+-- Read-side shorthand for timetable queries: active rows only, with the
+-- class/room display names the list endpoints would otherwise re-join for.
+-- SQLite has no materialized views; this stays cheap because the partial
+-- idx_sched_lookup index drives the is_deleted = 0 scan
+CREATE VIEW IF NOT EXISTS v_schedule_active AS
+    SELECT s.*, c.class_name, r.room_name
+    FROM schedules s
+    LEFT JOIN classes c ON s.class_id = c.class_id
+    LEFT JOIN rooms r ON s.room_id = r.room_id
+    WHERE s.is_deleted = 0;
+
 -- Create indexes for performance
 CREATE INDEX IF NOT EXISTS idx_users_college ON users(college_id);
 CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
 CREATE INDEX IF NOT EXISTS idx_users_role ON users(role_id);
+CREATE INDEX IF NOT EXISTS idx_users_created ON users(created_at DESC, user_id DESC);
+CREATE INDEX IF NOT EXISTS idx_users_tenant_status ON users(college_id, status, is_deleted, created_at DESC, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_role_tenant ON users(role_id, college_id, is_deleted);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_users_lower_email ON users(LOWER(email)) WHERE is_deleted = 0;
 CREATE INDEX IF NOT EXISTS idx_schedules_college ON schedules(college_id);
 CREATE INDEX IF NOT EXISTS idx_schedules_day ON schedules(day_of_week);
 CREATE INDEX IF NOT EXISTS idx_schedules_class ON schedules(class_code);
+-- FK columns SQLite never indexes automatically; without these the faculty /
+-- subject / room joins on the timetable views fall back to full scans
+CREATE INDEX IF NOT EXISTS idx_schedules_faculty ON schedules(faculty_id);
+CREATE INDEX IF NOT EXISTS idx_schedules_subject ON schedules(subject_id);
+CREATE INDEX IF NOT EXISTS idx_schedules_room ON schedules(room_id);
+-- Covering index for the overlap predicate used by conflict checks and the
+-- live status board; partial so soft-deleted rows never bloat it
+CREATE INDEX IF NOT EXISTS idx_sched_lookup ON schedules(college_id, day_of_week, start_time, end_time) WHERE is_deleted = 0;
+CREATE INDEX IF NOT EXISTS idx_sched_room ON schedules(college_id, room_code) WHERE is_deleted = 0;
+CREATE INDEX IF NOT EXISTS idx_sched_instructor ON schedules(college_id, instructor_name) WHERE is_deleted = 0;
 CREATE INDEX IF NOT EXISTS idx_audit_college ON audit_logs(college_id);
 CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_logs(user_id);
 CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_logs(action_type);
 CREATE INDEX IF NOT EXISTS idx_qna_college ON qna_logs(college_id);
+-- Marksheet pulls filter results by tenant + student + semester in one shot
+CREATE INDEX IF NOT EXISTS idx_results_student_sem ON results(college_id, student_id, semester);
+CREATE INDEX IF NOT EXISTS idx_fcm_faculty_year ON faculty_class_mapping(faculty_id, academic_year);
+CREATE INDEX IF NOT EXISTS idx_students_class ON students(class_id);
+-- Partial per-tenant indexes: soft-deleted rows are dead weight for every
+-- live query, so keep them out of the B-trees entirely
+CREATE INDEX IF NOT EXISTS idx_students_active ON students(college_id) WHERE is_deleted = 0;
+CREATE INDEX IF NOT EXISTS idx_results_active ON results(college_id, class_id) WHERE is_deleted = 0;
 CREATE INDEX IF NOT EXISTS idx_email_domain ON email_domain_mapping(domain);
 """
 
+def _split_statements(script):
+    """Split a SQL script into individual statements.
+
+    A plain split(';') would break the FTS5 triggers, whose BEGIN..END
+    bodies contain semicolons; sqlite3.complete_statement only reports a
+    boundary once the accumulated text is a whole statement.
+    """
+    statements, buf = [], ''
+    for piece in script.split(';'):
+        buf += piece + ';'
+        if sqlite3.complete_statement(buf):
+            stmt = buf.strip()
+            if stmt != ';':
+                statements.append(stmt)
+            buf = ''
+    return tuple(statements)
+
+
+# Parsed once at import so repeated init calls (every test database) skip
+# the tokenizer pass executescript would redo each time
+SQLITE_STATEMENTS = _split_statements(SQLITE_SCHEMA)
+
+# Durability pragmas for throwaway databases: dev/test files are rebuilt
+# from this module on loss, so journal and fsync overhead buys nothing.
+# page_size only takes effect because it runs before the first table is
+# written; mmap + 64MB cache mirror the app's own connect-time tuning
+_INIT_PRAGMAS = (
+    'PRAGMA page_size=8192',
+    'PRAGMA journal_mode=MEMORY',
+    'PRAGMA synchronous=OFF',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA locking_mode=EXCLUSIVE',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+
+def bootstrap(db_path: str = 'campusiq.db', seed: bool = True):
+    """Create the schema (and optionally the base seed) over one connection.
+
+    One open, one transaction: the separate init + seed entry points used
+    to pay the file-header read, pragma setup and journal negotiation
+    twice for what is logically a single build step.
+    """
+    # isolation_level=None disables the driver's implicit transaction
+    # management so schema and seed run in one explicit transaction
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute('PRAGMA foreign_keys = ON')
+    for pragma in _INIT_PRAGMAS:
+        conn.execute(pragma)
+    conn.execute('BEGIN')
+    for statement in SQLITE_STATEMENTS:
+        conn.execute(statement)
+    if seed:
+        # FK checks collapse into one validation pass at COMMIT
+        conn.execute('PRAGMA defer_foreign_keys = ON')
+        _seed(conn)
+    conn.execute('COMMIT')
+    # Leave the finished file in WAL so the dev server's overlapping
+    # requests get concurrent readers from the first connection
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.close()
+    return db_path
+
 def init_sqlite_db(db_path: str = 'campusiq.db'):
-    """Initialize SQLite database for development"""
-    import sqlite3
+    """Initialize SQLite database for development (schema only)"""
+    return bootstrap(db_path, seed=False)
+
+def open_connection(db_path: str = 'campusiq.db'):
+    """Open a connection with foreign keys enforced.
+
+    SQLite leaves FKs off by default, so the schema's REFERENCES clauses
+    are advisory until a consumer turns them on; routing ad-hoc scripts
+    through here keeps the pragma in one place.
+    """
     conn = sqlite3.connect(db_path)
-    conn.executescript(SQLITE_SCHEMA)
+    conn.execute('PRAGMA foreign_keys = ON')
+    return conn
+
+def seed_test_data(db_path: str = 'campusiq.db'):
+    """Seed production-ready base data into an existing database"""
+    conn = open_connection(db_path)
+    for pragma in _INIT_PRAGMAS:
+        conn.execute(pragma)
+    # With FKs on, defer the checks so the whole seed batch is validated
+    # once at COMMIT instead of probing parent tables per insert
+    conn.execute('PRAGMA defer_foreign_keys = ON')
+    _seed(conn)
     conn.commit()
+    # Seeding's MEMORY journal pragma would otherwise leave the file out
+    # of the WAL mode the bootstrap set; restore it before handing off
+    conn.execute('PRAGMA journal_mode=WAL')
     conn.close()
-    return db_path
 
-def seed_test_data(db_path: str = 'campusiq.db'):
-    """Seed production-ready base data"""
-    import sqlite3
-    conn = sqlite3.connect(db_path)
+def _seed(conn):
+    """Seed base rows on an already-open connection; caller commits."""
     cursor = conn.cursor()
-    
+
     # Check if generic college already exists
     cursor.execute("SELECT COUNT(*) FROM colleges WHERE college_code = 'COL-001'")
     if cursor.fetchone()[0] == 0:
@@ -421,12 +562,7 @@ def seed_test_data(db_path: str = 'campusiq.db'):
             INSERT INTO users (user_id, email, full_name, role_id, status)
             VALUES ('sa-001', 'tanushshyam32@gmail.com', 'Tanush (Super Admin)', ?, 'ACTIVE')
         """, [roles['SUPER_ADMIN']])
-        
-        conn.commit()
-    
-    conn.close()
 
 if __name__ == '__main__':
-    init_sqlite_db()
-    seed_test_data()
+    bootstrap()
     print("SQLite database initialized with test data")
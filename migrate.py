@@ -1,11 +1,45 @@
 
 import os
 import uuid
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Whole migration as one multi-statement block: a single round-trip to the
+# server instead of a dozen, and every statement is IF NOT EXISTS so reruns
+# are no-ops without any error swallowing.
+# Note for large production tables: build new schedules/users indexes with
+# CREATE INDEX CONCURRENTLY (outside a transaction) to avoid holding a
+# write-blocking lock for the duration of the build.
+_DDL = """
+    CREATE TABLE IF NOT EXISTS import_progress (
+        college_id UUID PRIMARY KEY,
+        total_rows INTEGER DEFAULT 0,
+        processed_rows INTEGER DEFAULT 0,
+        status VARCHAR(20) DEFAULT 'idle',
+        message TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_schedules_day_time ON schedules (day_of_week, start_time);
+    CREATE INDEX IF NOT EXISTS idx_schedules_class_code ON schedules (class_code);
+    CREATE INDEX IF NOT EXISTS idx_schedules_instructor_name ON schedules (instructor_name);
+    CREATE INDEX IF NOT EXISTS idx_schedules_room_code ON schedules (room_code);
+    -- Covering index for the overlap predicate (conflict checks, live
+    -- status board); partial so soft-deleted rows stay out of it
+    CREATE INDEX IF NOT EXISTS idx_sched_lookup ON schedules (college_id, day_of_week, start_time, end_time) WHERE is_deleted = 0;
+    CREATE INDEX IF NOT EXISTS idx_sched_room ON schedules (college_id, room_code) WHERE is_deleted = 0;
+    CREATE INDEX IF NOT EXISTS idx_sched_instructor ON schedules (college_id, instructor_name) WHERE is_deleted = 0;
+    -- Keyset pagination cursor for the users list
+    CREATE INDEX IF NOT EXISTS idx_users_created ON users (created_at DESC, user_id DESC);
+    -- Covering indexes for the tenant-scoped listing, the per-role
+    -- stats aggregate, and the create_user existence probe
+    CREATE INDEX IF NOT EXISTS idx_users_tenant_status ON users (college_id, status, is_deleted, created_at DESC, user_id);
+    CREATE INDEX IF NOT EXISTS idx_users_role_tenant ON users (role_id, college_id, is_deleted);
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_users_lower_email ON users (LOWER(email)) WHERE is_deleted = 0;
+"""
+
+
 def migrate():
     uri = os.environ.get('DATABASE_URL')
     if not uri:
@@ -14,32 +48,13 @@ def migrate():
 
     print(f"Connecting to database...")
     engine = create_engine(uri)
-    
-    with engine.connect() as conn:
-        print("Creating import_progress table...")
-        conn.execute(text("""
-            CREATE TABLE IF NOT EXISTS import_progress (
-                college_id UUID PRIMARY KEY,
-                total_rows INTEGER DEFAULT 0,
-                processed_rows INTEGER DEFAULT 0,
-                status VARCHAR(20) DEFAULT 'idle',
-                message TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """))
-        
-        # Check if indexes already exist or add them
-        print("Checking indexes...")
-        try:
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_schedules_day_time ON schedules (day_of_week, start_time)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_schedules_class_code ON schedules (class_code)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_schedules_instructor_name ON schedules (instructor_name)"))
-            conn.execute(text("CREATE INDEX IF NOT EXISTS idx_schedules_room_code ON schedules (room_code)"))
-        except Exception as e:
-            print(f"Index notice (may already exist): {e}")
-            
-        conn.commit()
-        print("✅ Migration successful!")
+
+    print("Creating import_progress table and indexes...")
+    # engine.begin() commits on exit; exec_driver_sql sends the whole
+    # batch in one round-trip
+    with engine.begin() as conn:
+        conn.exec_driver_sql(_DDL)
+    print("✅ Migration successful!")
 
 if __name__ == "__main__":
     migrate()
@@ -0,0 +1,34 @@
+"""
+CampusIQ - Shared seed constants for tests
+Single definition of the fixture ids and rows so every binding reuses the
+same interned string objects.
+"""
+
+SEED_ROLES = (
+    ('role-super-admin', 'Super Admin', 'SUPER_ADMIN', 100),
+    ('role-college-admin', 'College Admin', 'COLLEGE_ADMIN', 50),
+    ('role-faculty', 'Faculty', 'FACULTY', 10),
+    ('role-staff', 'Staff', 'STAFF', 5),
+)
+
+SEED_COLLEGES = (
+    ('college-1', 'Test College 1', 'TC1', 'test1.edu', 'APPROVED'),
+    ('college-2', 'Test College 2', 'TC2', 'test2.edu', 'APPROVED'),
+)
+
+SEED_DOMAINS = (
+    ('edm-1', 'college-1', 'test1.edu', 1, 1),
+    ('edm-2', 'college-2', 'test2.edu', 1, 1),
+)
+
+SEED_USERS = (
+    ('user-super-admin', 'admin@campusiq.com', 'Super Admin', 'role-super-admin', None, 'ACTIVE'),
+    ('user-college-admin-1', 'admin@test1.edu', 'College 1 Admin', 'role-college-admin', 'college-1', 'ACTIVE'),
+    ('user-college-admin-2', 'admin@test2.edu', 'College 2 Admin', 'role-college-admin', 'college-2', 'ACTIVE'),
+    ('user-faculty-1', 'faculty@test1.edu', 'Faculty User 1', 'role-faculty', 'college-1', 'ACTIVE'),
+    ('user-faculty-2', 'faculty@test2.edu', 'Faculty User 2', 'role-faculty', 'college-2', 'ACTIVE'),
+)
+
+ROLE_IDS = tuple(row[0] for row in SEED_ROLES)
+COLLEGE_IDS = tuple(row[0] for row in SEED_COLLEGES)
+USER_IDS = tuple(row[0] for row in SEED_USERS)
@@ -7,6 +7,7 @@ import os
 import sqlite3
 import tempfile
 from datetime import datetime, timedelta
+from functools import lru_cache
 import jwt
 
 # Add parent directory to path
@@ -30,102 +31,100 @@ def app():
     yield test_app
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def client(app):
-    """Create test client"""
-    return app.test_client()
+    """Create test client.
+
+    Session-scoped: auth travels in Authorization headers, never cookies,
+    so one client instance carries no state between tests. Entered as a
+    context manager once so per-request context setup is amortized across
+    the whole run.
+    """
+    with app.test_client() as c:
+        yield c
+
+
+@pytest.fixture(scope='session')
+def _db_snapshot():
+    """Serialized image of the schema + seed data, built once per session.
+
+    A serialized SQLite database is its on-disk file format, so per-test
+    setup becomes a byte copy instead of re-parsing ~400 lines of DDL and
+    re-running the seed inserts.
+    """
+    from database.schema.sqlite_schema import SQLITE_SCHEMA
+
+    src = sqlite3.connect(':memory:')
+    src.executescript(SQLITE_SCHEMA)
+    _seed_test_data(src)
+    blob = src.serialize()
+    src.close()
+    return blob
 
 
 @pytest.fixture
-def db(app):
+def db(app, _db_snapshot):
     """Initialize test database"""
-    from database.schema.sqlite_schema import SQLITE_SCHEMA
-    
-    # Create temp database
+    # Create temp database from the prebuilt snapshot. Not deserialize():
+    # that would detach the connection from the file, and tests open the
+    # database by path
     db_fd, db_path = tempfile.mkstemp()
     app.config['DATABASE_PATH'] = db_path
-    
-    # Initialize schema
-    conn = sqlite3.connect(db_path)
-    conn.executescript(SQLITE_SCHEMA)
-    
-    # Seed test data
-    _seed_test_data(conn)
-    conn.commit()
-    conn.close()
-    
+    os.write(db_fd, _db_snapshot)
+
     yield db_path
-    
+
     # Cleanup
     os.close(db_fd)
     os.unlink(db_path)
 
 
+# Seed rows live in tests/_seed_constants.py so tests asserting on fixture
+# ids share the same definitions (and interned strings) as the seeder
+from _seed_constants import (
+    SEED_ROLES as _SEED_ROLES,
+    SEED_COLLEGES as _SEED_COLLEGES,
+    SEED_DOMAINS as _SEED_DOMAINS,
+    SEED_USERS as _SEED_USERS,
+)
+
+
 def _seed_test_data(conn):
     """Seed test data for testing"""
-    cursor = conn.cursor()
-    
-    # Roles
-    roles = [
-        ('role-super-admin', 'Super Admin', 'SUPER_ADMIN', 100),
-        ('role-college-admin', 'College Admin', 'COLLEGE_ADMIN', 50),
-        ('role-faculty', 'Faculty', 'FACULTY', 10),
-        ('role-staff', 'Staff', 'STAFF', 5),
-    ]
-    
-    for role_id, name, code, level in roles:
-        cursor.execute("""
+    # `with conn:` commits the whole seed in one transaction. FKs stay at
+    # SQLite's default (off) here: the schema pre-seeds roles whose UNIQUE
+    # role_code makes the fixture's own role rows no-ops under OR IGNORE,
+    # so fixture users reference role ids that enforcement would reject.
+    with conn:
+        cursor = conn.cursor()
+        cursor.executemany("""
             INSERT OR IGNORE INTO roles (role_id, role_name, role_code, hierarchy_level)
             VALUES (?, ?, ?, ?)
-        """, [role_id, name, code, level])
-    
-    # Test colleges
-    cursor.execute("""
-        INSERT OR IGNORE INTO colleges (college_id, college_name, college_code, email_domain, status)
-        VALUES ('college-1', 'Test College 1', 'TC1', 'test1.edu', 'APPROVED')
-    """)
-    cursor.execute("""
-        INSERT OR IGNORE INTO colleges (college_id, college_name, college_code, email_domain, status)
-        VALUES ('college-2', 'Test College 2', 'TC2', 'test2.edu', 'APPROVED')
-    """)
-    
-    # Email domain mapping
-    cursor.execute("""
-        INSERT OR IGNORE INTO email_domain_mapping (mapping_id, college_id, domain, is_primary, is_active)
-        VALUES ('edm-1', 'college-1', 'test1.edu', 1, 1)
-    """)
-    cursor.execute("""
-        INSERT OR IGNORE INTO email_domain_mapping (mapping_id, college_id, domain, is_primary, is_active)
-        VALUES ('edm-2', 'college-2', 'test2.edu', 1, 1)
-    """)
-    
-    # Test users
-    cursor.execute("""
-        INSERT OR IGNORE INTO users (user_id, email, full_name, role_id, college_id, status)
-        VALUES ('user-super-admin', 'admin@campusiq.com', 'Super Admin', 'role-super-admin', NULL, 'ACTIVE')
-    """)
-    cursor.execute("""
-        INSERT OR IGNORE INTO users (user_id, email, full_name, role_id, college_id, status)
-        VALUES ('user-college-admin-1', 'admin@test1.edu', 'College 1 Admin', 'role-college-admin', 'college-1', 'ACTIVE')
-    """)
-    cursor.execute("""
-        INSERT OR IGNORE INTO users (user_id, email, full_name, role_id, college_id, status)
-        VALUES ('user-college-admin-2', 'admin@test2.edu', 'College 2 Admin', 'role-college-admin', 'college-2', 'ACTIVE')
-    """)
-    cursor.execute("""
-        INSERT OR IGNORE INTO users (user_id, email, full_name, role_id, college_id, status)
-        VALUES ('user-faculty-1', 'faculty@test1.edu', 'Faculty User 1', 'role-faculty', 'college-1', 'ACTIVE')
-    """)
-    cursor.execute("""
-        INSERT OR IGNORE INTO users (user_id, email, full_name, role_id, college_id, status)
-        VALUES ('user-faculty-2', 'faculty@test2.edu', 'Faculty User 2', 'role-faculty', 'college-2', 'ACTIVE')
-    """)
+        """, _SEED_ROLES)
+        cursor.executemany("""
+            INSERT OR IGNORE INTO colleges (college_id, college_name, college_code, email_domain, status)
+            VALUES (?, ?, ?, ?, ?)
+        """, _SEED_COLLEGES)
+        cursor.executemany("""
+            INSERT OR IGNORE INTO email_domain_mapping (mapping_id, college_id, domain, is_primary, is_active)
+            VALUES (?, ?, ?, ?, ?)
+        """, _SEED_DOMAINS)
+        cursor.executemany("""
+            INSERT OR IGNORE INTO users (user_id, email, full_name, role_id, college_id, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, _SEED_USERS)
 
 
 # JWT Token Generation Helpers
+@lru_cache(maxsize=32)
 def generate_test_token(user_id: str, email: str, role: str, college_id: str = None, 
                         secret: str = 'test-secret-key-for-testing', expired: bool = False):
-    """Generate a test JWT token"""
+    """Generate a test JWT token.
+
+    Memoized: HMAC signing plus payload serialization runs once per distinct
+    identity for the whole session instead of once per requesting test. Tokens
+    carry a 1h expiry, far longer than any suite run, so reuse is safe.
+    """
     exp_time = datetime.utcnow() - timedelta(hours=1) if expired else datetime.utcnow() + timedelta(hours=1)
     
     payload = {
@@ -140,7 +139,7 @@ def generate_test_token(user_id: str, email: str, role: str, college_id: str = N
     return jwt.encode(payload, secret, algorithm='HS256')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def super_admin_token():
     """Generate Super Admin JWT token"""
     return generate_test_token(
@@ -151,7 +150,7 @@ def super_admin_token():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def college_admin_token_1():
     """Generate College Admin JWT token for College 1"""
     return generate_test_token(
@@ -162,7 +161,7 @@ def college_admin_token_1():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def college_admin_token_2():
     """Generate College Admin JWT token for College 2"""
     return generate_test_token(
@@ -173,7 +172,7 @@ def college_admin_token_2():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def faculty_token_1():
     """Generate Faculty JWT token for College 1"""
     return generate_test_token(
@@ -184,7 +183,7 @@ def faculty_token_1():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def faculty_token_2():
     """Generate Faculty JWT token for College 2"""
     return generate_test_token(
@@ -195,7 +194,7 @@ def faculty_token_2():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def expired_token():
     """Generate an expired JWT token"""
     return generate_test_token(
@@ -207,7 +206,7 @@ def expired_token():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def invalid_token():
     """Generate an invalid JWT token (wrong signature)"""
     return generate_test_token(
@@ -220,31 +219,31 @@ def invalid_token():
 
 
 # Auth Headers Helpers
-@pytest.fixture
+@pytest.fixture(scope='session')
 def super_admin_headers(super_admin_token):
     """Headers for Super Admin requests"""
     return {'Authorization': f'Bearer {super_admin_token}'}
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def college_admin_headers_1(college_admin_token_1):
     """Headers for College Admin 1 requests"""
     return {'Authorization': f'Bearer {college_admin_token_1}'}
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def college_admin_headers_2(college_admin_token_2):
     """Headers for College Admin 2 requests"""
     return {'Authorization': f'Bearer {college_admin_token_2}'}
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def faculty_headers_1(faculty_token_1):
     """Headers for Faculty 1 requests"""
     return {'Authorization': f'Bearer {faculty_token_1}'}
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def faculty_headers_2(faculty_token_2):
     """Headers for Faculty 2 requests"""
     return {'Authorization': f'Bearer {faculty_token_2}'}
@@ -0,0 +1,43 @@
+"""
+CampusIQ - Shared Tenant Isolation Cases
+Cross-tenant cases previously duplicated across test files
+
+Not collected directly (no test_ prefix); test_tenant_isolation.py
+subclasses TenantIsolationCases so each logical assertion runs once.
+"""
+import pytest
+
+
+# (headers fixture name, route, caller's own college) per role under test
+_SCOPED_LIST_CASES = (
+    pytest.param('college_admin_headers_1', '/api/v1/college-admin/users',
+                 'college-1', id='college-admin-users'),
+    pytest.param('faculty_headers_1', '/api/v1/schedules?college_id=college-2',
+                 'college-1', id='faculty-schedules'),
+)
+
+
+class TenantIsolationCases:
+    """Cross-tenant scoping cases shared by the isolation suites"""
+
+    @pytest.mark.parametrize("headers_fixture,route,own_college", _SCOPED_LIST_CASES)
+    def test_list_results_scoped_to_own_college(self, request, client, db,
+                                                headers_fixture, route, own_college):
+        """Listings only ever return rows from the caller's own college"""
+        headers = request.getfixturevalue(headers_fixture)
+        response = client.get(route, headers=headers)
+
+        if response.status_code == 200:
+            data = response.get_json()
+            for item in data.get('items', []):
+                assert item.get('college_id') in (own_college, None)
+
+    def test_cross_tenant_user_deactivation_blocked(self, client, db, college_admin_headers_1):
+        """College Admin cannot deactivate users from another college"""
+        response = client.post(
+            '/api/v1/college-admin/users/user-faculty-2/deactivate',  # User from college-2
+            headers=college_admin_headers_1  # Admin from college-1
+        )
+
+        # Should be forbidden or not found (isolation should hide other college's users)
+        assert response.status_code in [403, 404]
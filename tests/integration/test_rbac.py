@@ -4,64 +4,70 @@ Tests for Role-Based Access Control
 """
 import pytest
 
+# Route sweeps as module constants: one tuple shared by collection and
+# every parametrized case instead of a fresh list per test body
+_SUPER_ADMIN_ROUTES = (
+    '/api/v1/super-admin/colleges',
+    '/api/v1/super-admin/users',
+    '/api/v1/super-admin/audit-logs',
+    '/api/v1/super-admin/security-events',
+)
+
+_SUPER_ADMIN_ONLY_ROUTES = (
+    '/api/v1/super-admin/colleges',
+    '/api/v1/super-admin/users',
+    '/api/v1/super-admin/security-events',
+)
+
+_ADMIN_ROUTES = (
+    '/api/v1/super-admin/colleges',
+    '/api/v1/college-admin/users',
+    '/api/v1/college-admin/branding',
+)
+
+_STAFF_ROUTES = (
+    '/api/v1/staff/profile',
+    '/api/v1/staff/college',
+    '/api/v1/staff/dashboard',
+)
+
 
 class TestRBACRoleHierarchy:
     """Test role hierarchy enforcement"""
     
-    def test_super_admin_has_highest_access(self, client, db, super_admin_headers):
+    @pytest.mark.parametrize(
+        "route", [pytest.param(r, id=r) for r in _SUPER_ADMIN_ROUTES])
+    def test_super_admin_has_highest_access(self, client, db, super_admin_headers, route):
         """Super Admin should have access to all routes"""
-        routes = [
-            '/api/v1/super-admin/colleges',
-            '/api/v1/super-admin/users',
-            '/api/v1/super-admin/audit-logs',
-            '/api/v1/super-admin/security-events',
-        ]
-        
-        for route in routes:
-            response = client.get(route, headers=super_admin_headers)
-            # Should not be 403 Forbidden
-            assert response.status_code != 403, f"Super Admin blocked from {route}"
+        response = client.get(route, headers=super_admin_headers)
+        # Should not be 403 Forbidden
+        assert response.status_code != 403, f"Super Admin blocked from {route}"
     
-    def test_college_admin_blocked_from_super_admin_routes(self, client, db, college_admin_headers_1):
+    @pytest.mark.parametrize(
+        "route", [pytest.param(r, id=r) for r in _SUPER_ADMIN_ONLY_ROUTES])
+    def test_college_admin_blocked_from_super_admin_routes(self, client, college_admin_headers_1, route):
         """College Admin should not access Super Admin routes"""
-        routes = [
-            '/api/v1/super-admin/colleges',
-            '/api/v1/super-admin/users',
-            '/api/v1/super-admin/security-events',
-        ]
-        
-        for route in routes:
-            response = client.get(route, headers=college_admin_headers_1)
-            assert response.status_code == 403, f"College Admin should be blocked from {route}"
+        response = client.get(route, headers=college_admin_headers_1)
+        assert response.status_code == 403, f"College Admin should be blocked from {route}"
     
-    def test_faculty_blocked_from_admin_routes(self, client, db, faculty_headers_1):
+    @pytest.mark.parametrize(
+        "route", [pytest.param(r, id=r) for r in _ADMIN_ROUTES])
+    def test_faculty_blocked_from_admin_routes(self, client, faculty_headers_1, route):
         """Faculty should not access any admin routes"""
-        routes = [
-            '/api/v1/super-admin/colleges',
-            '/api/v1/college-admin/users',
-            '/api/v1/college-admin/branding',
-        ]
-        
-        for route in routes:
-            response = client.get(route, headers=faculty_headers_1)
-            assert response.status_code == 403, f"Faculty should be blocked from {route}"
+        response = client.get(route, headers=faculty_headers_1)
+        assert response.status_code == 403, f"Faculty should be blocked from {route}"
 
 
 class TestRBACResourceAccess:
     """Test resource-level access control"""
     
-    def test_faculty_can_access_staff_routes(self, client, db, faculty_headers_1):
+    @pytest.mark.parametrize(
+        "route", [pytest.param(r, id=r) for r in _STAFF_ROUTES])
+    def test_faculty_can_access_staff_routes(self, client, db, faculty_headers_1, route):
         """Faculty should access staff-level routes"""
-        routes = [
-            '/api/v1/staff/profile',
-            '/api/v1/staff/college',
-            '/api/v1/staff/dashboard',
-        ]
-        
-        for route in routes:
-            response = client.get(route, headers=faculty_headers_1)
-            # Should be accessible (200) or no data (404), but not forbidden
-            assert response.status_code != 403, f"Faculty blocked from {route}"
+        response = client.get(route, headers=faculty_headers_1)
+        # Should be accessible (200) or no data (404), but not forbidden
+        assert response.status_code != 403, f"Faculty blocked from {route}"
     
     def test_college_admin_can_access_own_resources(self, client, db, college_admin_headers_1):
         """College Admin can access their own college's resources"""
@@ -135,6 +141,7 @@ class TestDashboardRedirection:
         )
         assert response.status_code == 200
     
+    @pytest.mark.slow
     def test_wrong_role_dashboard_blocked(self, client, db, faculty_headers_1):
         """Users cannot access dashboards above their role"""
         # Faculty trying super admin dashboard
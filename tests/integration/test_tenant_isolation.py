@@ -6,19 +6,23 @@ import pytest
 from flask import g
 from unittest.mock import patch, MagicMock
 
+from _tenant_isolation_cases import TenantIsolationCases
+
+
+class TestTenantIsolationShared(TenantIsolationCases):
+    """Cross-tenant cases shared with the permission suite (see
+    _tenant_isolation_cases.py)"""
+
 
 class TestTenantIsolation:
     """Test suite for multi-tenant data isolation"""
     
-    def test_user_cannot_access_other_college_data(self, client, auth_headers_college_a):
+    def test_user_cannot_access_other_college_data(self, client, auth_headers_college_a_cross_tenant):
         """Verify users cannot access data from other colleges"""
         # User from College A trying to access College B's schedules
         response = client.get(
             '/api/v1/schedules/',
-            headers={
-                **auth_headers_college_a,
-                'X-Tenant-ID': 'college-b-id'  # Attempting cross-tenant access
-            }
+            headers=auth_headers_college_a_cross_tenant
         )
         
         assert response.status_code == 403
@@ -38,26 +42,20 @@ class TestTenantIsolation:
             assert 'college_id' in call_args.kwargs
             assert call_args.kwargs['college_id'] == 'college-a-id'
     
-    def test_super_admin_can_view_any_college(self, client, auth_headers_super_admin):
+    def test_super_admin_can_view_any_college(self, client, auth_headers_super_admin_cross_tenant):
         """Super admins can view any college's data (read-only)"""
         response = client.get(
             '/api/v1/schedules/',
-            headers={
-                **auth_headers_super_admin,
-                'X-Tenant-ID': 'college-b-id'
-            }
+            headers=auth_headers_super_admin_cross_tenant
         )
         
         assert response.status_code == 200
     
-    def test_super_admin_cannot_modify_college_data(self, client, auth_headers_super_admin):
+    def test_super_admin_cannot_modify_college_data(self, client, auth_headers_super_admin_cross_tenant):
         """Super admins have read-only access to college data"""
         response = client.post(
             '/api/v1/schedules/',
-            headers={
-                **auth_headers_super_admin,
-                'X-Tenant-ID': 'college-b-id'
-            },
+            headers=auth_headers_super_admin_cross_tenant,
             json={
                 'day_of_week': 1,
                 'start_time': '09:00',
@@ -90,26 +88,24 @@ class TestTenantIsolation:
         for schedule in data.get('data', {}).get('items', []):
             assert schedule['college_id'] == 'college-a-id'
     
-    def test_sql_injection_in_college_id_blocked(self, client, auth_headers_college_a):
+    @pytest.mark.parametrize("malicious_id", [
+        "' OR '1'='1",
+        "; DROP TABLE schedules;--",
+        "1; SELECT * FROM users;--",
+        "' UNION SELECT * FROM colleges--",
+    ])
+    def test_sql_injection_in_college_id_blocked(self, client, auth_headers_college_a, malicious_id):
         """SQL injection attempts in college_id should be blocked"""
-        malicious_ids = [
-            "' OR '1'='1",
-            "; DROP TABLE schedules;--",
-            "1; SELECT * FROM users;--",
-            "' UNION SELECT * FROM colleges--"
-        ]
-        
-        for malicious_id in malicious_ids:
-            response = client.get(
-                '/api/v1/schedules/',
-                headers={
-                    **auth_headers_college_a,
-                    'X-Tenant-ID': malicious_id
-                }
-            )
-            
-            # Should either reject or sanitize - not execute
-            assert response.status_code in [400, 403]
+        response = client.get(
+            '/api/v1/schedules/',
+            headers={
+                **auth_headers_college_a,
+                'X-Tenant-ID': malicious_id
+            }
+        )
+
+        # Should either reject or sanitize - not execute
+        assert response.status_code in [400, 403]
 
 
 class TestRoleBasedAccess:
@@ -214,44 +210,78 @@ class TestSecurityControls:
 
 class TestAuditLogging:
     """Test suite for audit logging"""
-    
-    def test_login_is_logged(self, client):
+
+    @pytest.fixture(autouse=True, scope='class')
+    def audit_log_mock(self):
+        """AuditService.log patched once for the whole class; tests call
+        reset_mock() instead of paying patcher setup/teardown per test"""
+        with patch('app.services.audit_service.AuditService.log') as m:
+            yield m
+
+    def test_login_is_logged(self, app, audit_log_mock):
         """Login attempts are logged"""
-        with patch('app.services.audit_service.AuditService.log') as mock_log:
-            client.post('/api/v1/auth/google/token', json={'code': 'test-code'})
-            
-            mock_log.assert_called()
-            call_args = mock_log.call_args
+        from app.services.auth_service import AuthService
+
+        # Call the service directly with Google's endpoints mocked; the
+        # HTTP-level variant below keeps full-stack coverage under `slow`
+        token_response = MagicMock(status_code=200)
+        token_response.json.return_value = {'access_token': 'google-token'}
+        userinfo_response = MagicMock()
+        userinfo_response.json.return_value = {
+            'email': 'admin@campusiq.com', 'sub': 'google-123', 'name': 'Super Admin'
+        }
+
+        audit_log_mock.reset_mock()
+        with app.app_context(), \
+                patch('app.services.auth_service.requests.post', return_value=token_response), \
+                patch('app.services.auth_service.requests.get', return_value=userinfo_response):
+            try:
+                AuthService().process_google_callback('test-code', 'http://localhost/')
+            except Exception:
+                pass
+
+            audit_log_mock.assert_called()
+            call_args = audit_log_mock.call_args
             assert call_args.kwargs['action_type'] == 'LOGIN'
+
+    @pytest.mark.slow
+    def test_login_is_logged_http(self, client, audit_log_mock):
+        """Login attempts are logged (full request lifecycle)"""
+        audit_log_mock.reset_mock()
+        client.post('/api/v1/auth/google/token', json={'code': 'test-code'})
+
+        audit_log_mock.assert_called()
+        call_args = audit_log_mock.call_args
+        assert call_args.kwargs['action_type'] == 'LOGIN'
     
-    def test_schedule_creation_logged(self, client, auth_headers_college_admin):
+    def test_schedule_creation_logged(self, client, auth_headers_college_admin, audit_log_mock):
         """Schedule creation is logged"""
-        with patch('app.services.audit_service.AuditService.log') as mock_log:
-            client.post(
-                '/api/v1/schedules/',
-                headers=auth_headers_college_admin,
-                json={
-                    'day_of_week': 1,
-                    'start_time': '09:00',
-                    'end_time': '10:00',
-                    'class_code': 'TEST'
-                }
-            )
-            
-            mock_log.assert_called()
-            call_args = mock_log.call_args
-            assert call_args.kwargs['action_type'] == 'CREATE'
-            assert call_args.kwargs['entity_type'] == 'schedule'
+        audit_log_mock.reset_mock()
+        client.post(
+            '/api/v1/schedules/',
+            headers=auth_headers_college_admin,
+            json={
+                'day_of_week': 1,
+                'start_time': '09:00',
+                'end_time': '10:00',
+                'class_code': 'TEST'
+            }
+        )
+
+        audit_log_mock.assert_called()
+        call_args = audit_log_mock.call_args
+        assert call_args.kwargs['action_type'] == 'CREATE'
+        assert call_args.kwargs['entity_type'] == 'schedule'
     
-    def test_sensitive_data_not_logged(self, client, auth_headers_college_admin):
+    def test_sensitive_data_not_logged(self, client, auth_headers_college_admin, audit_log_mock):
         """Sensitive data like tokens are not logged"""
-        with patch('app.services.audit_service.AuditService.log') as mock_log:
-            client.get('/api/v1/users/me', headers=auth_headers_college_admin)
-            
-            if mock_log.called:
-                logged_data = str(mock_log.call_args)
-                assert 'Bearer' not in logged_data
-                assert 'token' not in logged_data.lower()
+        audit_log_mock.reset_mock()
+        client.get('/api/v1/users/me', headers=auth_headers_college_admin)
+
+        if audit_log_mock.called:
+            logged_data = str(audit_log_mock.call_args)
+            assert 'Bearer' not in logged_data
+            assert 'token' not in logged_data.lower()
 
 
 # Pytest Fixtures
@@ -260,7 +290,7 @@ def client(app):
     """Test client fixture"""
     return app.test_client()
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def auth_headers_college_a():
     """Auth headers for College A user"""
     return {
@@ -268,7 +298,7 @@ def auth_headers_college_a():
         'Content-Type': 'application/json'
     }
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def auth_headers_college_admin():
     """Auth headers for College Admin"""
     return {
@@ -276,7 +306,7 @@ def auth_headers_college_admin():
         'Content-Type': 'application/json'
     }
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def auth_headers_super_admin():
     """Auth headers for Super Admin"""
     return {
@@ -284,7 +314,7 @@ def auth_headers_super_admin():
         'Content-Type': 'application/json'
     }
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def auth_headers_faculty():
     """Auth headers for Faculty user"""
     return {
@@ -292,7 +322,7 @@ def auth_headers_faculty():
         'Content-Type': 'application/json'
     }
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def auth_headers_pending_college():
     """Auth headers for user from pending college"""
     return {
@@ -300,9 +330,19 @@ def auth_headers_pending_college():
         'Content-Type': 'application/json'
     }
 
-@pytest.fixture
+@pytest.fixture(scope='session')
+def auth_headers_college_a_cross_tenant(auth_headers_college_a):
+    """College A headers carrying College B's tenant id, merged once"""
+    return {**auth_headers_college_a, 'X-Tenant-ID': 'college-b-id'}
+
+@pytest.fixture(scope='session')
+def auth_headers_super_admin_cross_tenant(auth_headers_super_admin):
+    """Super Admin headers carrying College B's tenant id, merged once"""
+    return {**auth_headers_super_admin, 'X-Tenant-ID': 'college-b-id'}
+
+@pytest.fixture(scope='session')
 def expired_token():
-    """Generate an expired JWT token"""
+    """Generate an expired JWT token, signed once per session"""
     import jwt
     from datetime import datetime, timedelta
     